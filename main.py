@@ -20,23 +20,50 @@ Version: 1.0
 import os
 import re
 import io
+import copy
 import uuid
-import shutil
 import logging
 import tempfile
 import asyncio
+import hashlib
+import zipfile
+import functools
+import multiprocessing
+from collections import ChainMap, Counter
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterable, Iterator, Mapping, Optional
+import aiofiles
 import certifi
+import diskcache
 import httpx
+from aiolimiter import AsyncLimiter
 from fastapi import FastAPI, UploadFile, File, Form, Request, HTTPException
-from fastapi.responses import HTMLResponse, FileResponse, JSONResponse
+from fastapi.responses import HTMLResponse, FileResponse, JSONResponse, ORJSONResponse, StreamingResponse
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from docx import Document
-import xml.etree.ElementTree as ET
+from lxml import etree
 import csv
 
+# orjson decodes API responses and encodes our JSON responses several times
+# faster than the standard library; fall back to json when it is not installed
+try:
+    import orjson
+    json_loads = orjson.loads
+    
+    def json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+    
+    DefaultJSONResponse = ORJSONResponse
+except ImportError:
+    import json
+    json_loads = json.loads
+    json_dumps = json.dumps
+    DefaultJSONResponse = JSONResponse
+
 # =============================================================================
 # CONFIGURATION & LOGGING SETUP
 # =============================================================================
@@ -50,7 +77,112 @@ logging.basicConfig(
 
 # Application configuration constants
 MAX_UPLOAD_BYTES = 50 * 1024 * 1024  # 50 MB maximum file size
+UPLOAD_FORM_OVERHEAD = 64 * 1024     # Allowance for multipart boundaries and form fields
+UPLOAD_CHUNK_BYTES = 1024 * 1024     # Chunk size when streaming uploads to disk
 CURRENT_YEAR = datetime.now().year    # Current year for citation validation
+WEB_CONCURRENCY = max(1, int(os.environ.get("WEB_CONCURRENCY", "1")))  # Server worker processes
+PROCESS_POOL_MIN_BYTES = 5 * 1024 * 1024  # Parse larger documents in a worker process
+PARALLEL_FORMATTING = os.environ.get("PARALLEL_FORMATTING", "").lower() in ("1", "true", "yes")
+PARALLEL_FORMAT_MIN_CITATIONS = 32     # Smaller bibliographies are formatted in-process
+DOI_CACHE_DIR = os.environ.get("DOI_CACHE_DIR", "cache")  # Persistent lookup cache
+LOOKUP_CACHE_TTL = 30 * 24 * 3600      # Keep resolved lookups for 30 days
+LOOKUP_MISS_TTL = 7 * 24 * 3600        # Retry unresolved lookups after 7 days
+CITATION_MISS_TTL = 24 * 3600          # Retry citations with no DOI after a day
+NCBI_API_KEY = os.environ.get("NCBI_API_KEY")  # Optional, raises the PubMed rate limit
+CROSSREF_FALLBACK = os.environ.get("CROSSREF_FALLBACK", "").lower() in ("1", "true", "yes")  # Query CrossRef after a PubMed miss
+MAX_CONCURRENT_LOOKUPS = int(os.environ.get("MAX_CONCURRENT_LOOKUPS", "8"))  # In-flight citation lookups
+JOB_STORE_DIR = os.environ.get("JOB_STORE_DIR", "jobs")  # Shared job record store
+JOB_TTL = 24 * 3600                    # Job records expire after 24 hours
+TEMP_DIR = os.environ.get("TEMP_DIR", "temp")  # Uploaded and generated documents
+REAPER_INTERVAL = 3600                 # Seconds between sweeps of expired jobs and files
+JOB_EVENT_INTERVAL = 0.5               # Seconds between job store checks for /events
+LOOKUP_TIME_LIMIT = 45.0               # Seconds allowed for all searches of one citation
+PROGRESS_SAVE_EVERY = 5                # Persist lookup progress every N citations...
+PROGRESS_SAVE_INTERVAL = 0.5           # ...or after this many seconds, whichever is first
+JOB_EVENT_KEEPALIVE = 15.0             # Seconds of silence before an SSE keepalive comment
+
+# =============================================================================
+# PRECOMPILED REGEX PATTERNS
+# =============================================================================
+
+# Patterns are compiled once at import time so the extraction helpers, which
+# run once per citation, never pay for pattern cache lookups or flag parsing.
+
+# References section: a "References"/"Bibliography" header line followed by
+# content up to the next appendix/acknowledgment/table/figure/author heading,
+# or to the end of the document. One alternation covers every header and
+# terminator combination in a single scan.
+_REF_SECTION = re.compile(
+    r"\n\s*(?:references?|bibliography)\s*\n(.*?)"
+    r"(?=\n\s*(?:appendix|acknowledgment|table|figure|author)|\Z)",
+    re.IGNORECASE | re.DOTALL
+)
+
+# The same header and terminator, applied to one streamed paragraph at a time
+_REF_HEADING = re.compile(r"\s*(?:references?|bibliography)\s*$", re.IGNORECASE)
+_REF_SECTION_END = re.compile(r"\s*(?:appendix|acknowledgment|table|figure|author)", re.IGNORECASE)
+
+# Headings that end the references section being replaced in apply_dois_to_document
+_REF_STOP_RE = re.compile(r"\s*(?:appendix|acknowledgment)", re.IGNORECASE)
+
+# Bare DOI (10.xxxx/xxxxx). Prefixed forms such as "doi:10.x/y" or
+# "https://doi.org/10.x/y" contain the bare DOI, so a single scan finds all of
+# them without ever capturing the prefix.
+_DOI_ANY = re.compile(r"10\.\d{4,}/[^\s)\]\n,;]+")
+
+# Numbered citations, either "1. Author" or "[1] Author", matched in one pass.
+# Each entry runs until the next numbered entry or the end of the text.
+_CITATION_SPLIT = re.compile(
+    r"((?:^|\n)\s*(?:\d+\.|\[\d+\])\s*.*?)(?=\n\s*(?:\d+\.|\[\d+\])|\Z)",
+    re.MULTILINE | re.DOTALL
+)
+
+# Citation cleanup and validation helpers
+_CITATION_CLEAN = re.compile(r"^\s*(?:\d+\.|\[\d+\])\s*(.*?)\s*$", re.DOTALL)
+_AUTHOR_PATTERN = re.compile(r"[A-Z][a-z]+,\s*[A-Z]")
+_YEAR_RE = re.compile(r"\b(?:19|20)\d{2}\b")
+_DIGIT_RE = re.compile(r"\d")
+
+# Year patterns in order of preference (most specific first)
+_YEAR_PATTERNS = [
+    re.compile(pattern)
+    for pattern in (
+        # Pattern 1: Year in parentheses (2023)
+        r"\((\d{4})\)",
+        # Pattern 2: Year followed by punctuation (2023; or 2023,)
+        r"\b(\d{4})[;,.]",
+        # Pattern 3: Any 4-digit year in 1900-2099 range
+        r"\b(19|20)\d{2}\b",
+    )
+]
+
+# Title extraction patterns used to build search queries
+_TITLE_PATTERNS = [
+    re.compile(pattern)
+    for pattern in (
+        # Pattern 1: Text in quotes (often article titles)
+        r'"([^"]{10,})"',
+        # Pattern 2: Text after year (common in citations)
+        r'\d{4}[;,.]?\s*([A-Z][^.]{10,}?)\.',
+        # Pattern 3: Text after period (fallback)
+        r'\.?\s*([A-Z][^.]{10,}?)\.',
+    )
+]
+
+# Source routing hints: biomedical journal names and abbreviations suggest
+# PubMed; proceedings, books and preprints are rarely indexed there and
+# suggest CrossRef. Vancouver "2019;74(3):123" locators and generic "Eur J"
+# style abbreviations are shared by every AMA-formatted field, so they are
+# not treated as biomedical signals.
+_PUBMED_HINTS = re.compile(
+    r"\bN Engl J Med\b"
+    r"|\bJ (?:Clin|Biol|Med|Exp Med|Pediatr|Surg|Neurosci)\b"
+    r"|\b(?:Lancet|BMJ|JAMA|PLoS|Med|Clin|Surg|Cardiol|Oncol|Pediatr|Nurs|Psychiatry|Epidemiol)\b"
+)
+_CROSSREF_HINTS = re.compile(
+    r"\b(?:Proceedings|Proc|Conference|Conf|Symposium|Workshop|ISBN|arXiv|Press|Publishers?)\b",
+    re.IGNORECASE
+)
 
 # =============================================================================
 # FASTAPI APPLICATION SETUP
@@ -60,16 +192,181 @@ CURRENT_YEAR = datetime.now().year    # Current year for citation validation
 app = FastAPI(
     title="Bulk DOI Finder",
     description="Automatically extract and format academic citations with DOIs",
-    version="1.0.0"
+    version="1.0.0",
+    # Job results can carry thousands of citations; serialize them with orjson
+    default_response_class=DefaultJSONResponse
 )
 
 # Mount static files and templates directories
 app.mount("/static", StaticFiles(directory="static"), name="static")
 templates = Jinja2Templates(directory="templates")
 
-# In-memory job storage for processing status and results
-# In production, this should be replaced with a proper database
-jobs = {}
+class StreamAwareGZipMiddleware(GZipMiddleware):
+    """
+    GZip middleware that leaves Server-Sent Event streams uncompressed.
+    
+    The gzip compressor holds small writes back until it has a full block,
+    which would delay each progress event on /events indefinitely.
+    """
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith("/events/"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+# Compress JSON job results, CSV exports and pages above 1 KB. Level 5 gets
+# most of the size reduction of level 9 at a fraction of the CPU cost.
+app.add_middleware(StreamAwareGZipMiddleware, minimum_size=1024, compresslevel=5)
+
+@app.middleware("http")
+async def limit_upload_size(request: Request, call_next):
+    """
+    Reject oversized uploads from the Content-Length header alone.
+    
+    FastAPI parses the multipart body before the upload handler runs, so a
+    size check inside the handler only fires after the whole file has been
+    received. Checking the declared length here answers with HTTP 413
+    before any of the body is read.
+    
+    Note:
+        Requests without a Content-Length (chunked transfer encoding) pass
+        through; upload_file enforces the limit while streaming to disk.
+    """
+    
+    if request.method == "POST" and request.url.path == "/upload":
+        content_length = request.headers.get("content-length", "")
+        if content_length.isdigit() and int(content_length) > MAX_UPLOAD_BYTES + UPLOAD_FORM_OVERHEAD:
+            return JSONResponse(
+                status_code=413,
+                content={"detail": f"File too large. Max size: {MAX_UPLOAD_BYTES // (1024*1024)}MB"}
+            )
+    
+    return await call_next(request)
+
+# Identifies this server process in job claims; a claim carrying any other
+# token belongs to another process, live or dead
+_CLAIM_TOKEN = f"{os.getpid()}-{uuid.uuid4().hex}"
+
+class JobStore:
+    """
+    Job records persisted in an SQLite-backed diskcache store.
+    
+    Every Uvicorn/Gunicorn worker process opens the same store, so a status
+    poll served by one worker sees a job uploaded to or processed by another.
+    Records expire automatically after JOB_TTL seconds.
+    
+    The citations list is kept under its own key, next to a small summary
+    record (status, progress, timestamps). Progress updates and status polls
+    read and write only the summary instead of the whole citation list.
+    
+    Reads return a private copy of the record; callers that modify a job must
+    call save() (or save_progress() for summary-only changes) to publish it.
+    """
+    
+    def __init__(self, directory: str, ttl: int):
+        self._cache = diskcache.Cache(directory)
+        self._ttl = ttl
+    
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._cache
+    
+    def __getitem__(self, job_id: str) -> Dict:
+        job = self.get(job_id)
+        if job is None:
+            raise KeyError(job_id)
+        return job
+    
+    def __setitem__(self, job_id: str, job: Dict):
+        summary = dict(job)
+        citations = summary.pop("citations", [])
+        with self._cache.transact():
+            self._cache.set(("citations", job_id), citations, expire=self._ttl)
+            self._cache.set(job_id, summary, expire=self._ttl)
+    
+    def get(self, job_id: str) -> Optional[Dict]:
+        """Return the full job record, or None if it does not exist or expired."""
+        with self._cache.transact():
+            job = self._cache.get(job_id)
+            if job is not None:
+                job["citations"] = self._cache.get(("citations", job_id), [])
+        return job
+    
+    def get_summary(self, job_id: str) -> Optional[Dict]:
+        """Return the job record without its citations, or None if missing."""
+        return self._cache.get(job_id)
+    
+    def save(self, job: Dict):
+        """Persist a (modified) job record, including citations, under its id."""
+        self[job["id"]] = job
+    
+    def save_progress(self, job: Dict):
+        """Persist only the summary fields of a job, leaving citations as stored."""
+        summary = {key: value for key, value in job.items() if key != "citations"}
+        self._cache.set(job["id"], summary, expire=self._ttl)
+    
+    def claim(self, job_id: str, ttl: int) -> bool:
+        """
+        Atomically claim a job for processing by this worker process.
+        
+        Returns False if another process already holds the claim, so a job
+        re-queued by several workers at startup is only processed once. The
+        claim carries this process's token and expires after ttl seconds
+        unless refreshed, so a claim left by a process that died goes stale
+        quickly.
+        """
+        return self._cache.add(("claim", job_id), _CLAIM_TOKEN, expire=ttl)
+    
+    def refresh_claim(self, job_id: str, ttl: int) -> bool:
+        """Extend this process's claim on a job; False if it no longer holds it."""
+        key = ("claim", job_id)
+        with self._cache.transact():
+            if self._cache.get(key) != _CLAIM_TOKEN:
+                return False
+            return self._cache.touch(key, expire=ttl)
+    
+    def release(self, job_id: str):
+        """Drop this process's claim on a job so it can be picked up again."""
+        key = ("claim", job_id)
+        with self._cache.transact():
+            if self._cache.get(key) == _CLAIM_TOKEN:
+                self._cache.delete(key)
+    
+    def is_claimed(self, job_id: str) -> bool:
+        """Return True if some process currently holds a claim on the job."""
+        return ("claim", job_id) in self._cache
+    
+    def expire(self) -> int:
+        """Remove expired records from the store and return how many were removed."""
+        return self._cache.expire()
+    
+    def referenced_files(self) -> set:
+        """Return the resolved paths of every document a live job refers to."""
+        paths = set()
+        for key in self._cache.iterkeys():
+            if not isinstance(key, str):
+                continue
+            job = self._cache.get(key)
+            if job is None:
+                continue
+            for field in ("filepath", "output_path"):
+                if job.get(field):
+                    paths.add(os.path.realpath(job[field]))
+        return paths
+    
+    def unfinished(self) -> List[str]:
+        """Return the ids of jobs that are still queued or were interrupted."""
+        job_ids = []
+        for key in self._cache.iterkeys():
+            if not isinstance(key, str):
+                continue
+            job = self._cache.get(key)
+            if job is not None and job.get("status") in ("uploaded", "processing"):
+                job_ids.append(key)
+        return job_ids
+
+# Job storage for processing status and results, shared by all workers
+jobs = JobStore(JOB_STORE_DIR, JOB_TTL)
 
 # =============================================================================
 # CITATION EXTRACTION FUNCTIONS
@@ -79,9 +376,9 @@ def extract_references_section(text: str) -> str:
     """
     Extract the references section from document text.
     
-    This function uses multiple regex patterns to identify and extract the
-    references section from academic documents. It tries various common
-    patterns for references sections and falls back to using the last
+    This function uses a single combined regex to identify and extract the
+    references section from academic documents. It tries each references
+    or bibliography header in turn and falls back to using the last
     30% of the document if no clear references section is found.
     
     Args:
@@ -95,28 +392,13 @@ def extract_references_section(text: str) -> str:
         and handles various formatting styles common in academic papers.
     """
     
-    # Common patterns for references section headers
-    # These patterns account for different formatting styles and variations
-    ref_patterns = [
-        # Pattern 1: References followed by content until appendix/acknowledgment
-        r"(?i)\n\s*references?\s*\n(.*?)(?=\n\s*(?:appendix|acknowledgment|table|figure|author))",
-        # Pattern 2: Bibliography followed by content until appendix/acknowledgment  
-        r"(?i)\n\s*bibliography\s*\n(.*?)(?=\n\s*(?:appendix|acknowledgment|table|figure|author))",
-        # Pattern 3: References at end of document
-        r"(?i)\n\s*references?\s*\n(.*?)$",
-        # Pattern 4: Bibliography at end of document
-        r"(?i)\n\s*bibliography\s*\n(.*?)$",
-    ]
-    
-    # Try each pattern to find the references section
-    for pattern in ref_patterns:
-        match = re.search(pattern, text, re.DOTALL)
-        if match:
-            ref_text = match.group(1).strip()
-            # Only return if we found a substantial references section
-            if len(ref_text) > 100:  # Minimum length threshold
-                logger.info(f"Found references section with {len(ref_text)} characters")
-                return ref_text
+    # Try each references header in the document
+    for match in _REF_SECTION.finditer(text):
+        ref_text = match.group(1).strip()
+        # Only return if we found a substantial references section
+        if len(ref_text) > 100:  # Minimum length threshold
+            logger.info(f"Found references section with {len(ref_text)} characters")
+            return ref_text
     
     # Fallback strategy: use the last 30% of the document
     # References are typically located at the end of academic papers
@@ -125,13 +407,66 @@ def extract_references_section(text: str) -> str:
     logger.warning("No clear references section found, using last 30% of document")
     return fallback_text
 
+def extract_references_from_paragraphs(paragraphs: Iterable[str]) -> Optional[str]:
+    """
+    Extract the references section from a stream of paragraph texts.
+    
+    Paragraphs are scanned as they arrive: once a "References" or
+    "Bibliography" heading paragraph is seen, the following paragraphs are
+    collected until a terminator heading (appendix, acknowledgment, table,
+    figure, author) or the end of the document. The first section longer
+    than 100 characters is returned immediately. Text before the heading
+    is never kept, so the rest of the document is never held in memory or
+    joined into one string.
+    
+    Args:
+        paragraphs (Iterable[str]): Paragraph texts in document order
+        
+    Returns:
+        Optional[str]: Extracted references section text, or None if no
+            heading yields a usable section
+        
+    Note:
+        On None, callers fall back to extract_references_section over the
+        full text, which applies the same header regex and then takes the
+        last 30% of the document.
+    """
+    
+    section = None   # Paragraphs of the references section being collected
+    
+    for text in paragraphs:
+        if section is not None:
+            if not _REF_SECTION_END.match(text):
+                section.append(text)
+                continue
+            
+            # Terminator heading reached: accept the section if substantial
+            ref_text = "\n".join(section).strip()
+            if len(ref_text) > 100:  # Minimum length threshold
+                logger.info(f"Found references section with {len(ref_text)} characters")
+                return ref_text
+            section = None
+        
+        if _REF_HEADING.match(text):
+            section = []
+    
+    # References section running to the end of the document
+    if section is not None:
+        ref_text = "\n".join(section).strip()
+        if len(ref_text) > 100:
+            logger.info(f"Found references section with {len(ref_text)} characters")
+            return ref_text
+    
+    return None
+
+@functools.lru_cache(maxsize=4096)
 def extract_doi_from_citation(citation_text: str) -> Optional[str]:
     """
     Extract DOI from citation text if it already contains one.
     
-    This function searches for existing DOIs in citation text using various
-    common DOI patterns and formats. It handles different DOI representations
-    including bare DOIs, DOI: prefixed formats, and full URLs.
+    This function searches for existing DOIs in citation text with a single
+    bare-DOI pattern. Because the prefixed representations (DOI: prefixed
+    formats and full URLs) embed the bare DOI, they are all handled too.
     
     Args:
         citation_text (str): Citation text to search for DOI
@@ -144,34 +479,23 @@ def extract_doi_from_citation(citation_text: str) -> Optional[str]:
         "10.1234/example"
         >>> extract_doi_from_citation("https://doi.org/10.1234/example")
         "10.1234/example"
+        
+    Note:
+        Results are memoized per citation string, so re-parsing the same
+        references (e.g. a re-uploaded document) skips the regex work.
     """
     
-    # DOI patterns in order of preference (most specific first)
-    doi_patterns = [
-        # Pattern 1: Bare DOI format (10.xxxx/xxxxx)
-        r"10\.\d{4,}/[^\s\)\]\n]+",
-        # Pattern 2: DOI with "doi:" prefix (case insensitive)
-        r"doi:\s*10\.\d{4,}/[^\s\)\]\n]+",
-        # Pattern 3: DOI with "DOI:" prefix (case insensitive)
-        r"DOI:\s*10\.\d{4,}/[^\s\)\]\n]+", 
-        # Pattern 4: Full DOI URL (dx.doi.org or doi.org)
-        r"https?://(?:dx\.)?doi\.org/10\.\d{4,}/[^\s\)\]\n]+",
-    ]
+    # Every DOI starts with "10.", so skip the regex when it is absent
+    if "10." not in citation_text:
+        return None
     
-    # Search for DOI using each pattern
-    for pattern in doi_patterns:
-        match = re.search(pattern, citation_text, re.IGNORECASE)
-        if match:
-            doi = match.group(0)
-            
-            # Clean up DOI by removing prefixes and trailing characters
-            # Remove "doi:", "DOI:", or URL prefixes
-            doi = re.sub(r"^(doi:|DOI:|https?://(?:dx\.)?doi\.org/)\s*", "", doi, flags=re.IGNORECASE)
-            # Remove trailing whitespace, parentheses, brackets, or newlines
-            doi = re.sub(r"[\s\)\]\n]+$", "", doi)
-            
-            logger.debug(f"Extracted DOI from citation: {doi.strip()}")
-            return doi.strip()
+    # A single pass over the text finds bare, "doi:" prefixed and URL DOIs
+    match = _DOI_ANY.search(citation_text)
+    if match:
+        # Remove trailing punctuation that belongs to the sentence, not the DOI
+        doi = match.group(0).rstrip(".,;")
+        logger.debug(f"Extracted DOI from citation: {doi}")
+        return doi
     
     return None
 
@@ -198,30 +522,25 @@ def split_citations(reference_text: str) -> List[str]:
     
     citations = []
     
-    # Strategy 1: Try numbered citation patterns
+    # Strategy 1: Numbered or bracketed citations
     # These are the most common formats in academic papers
-    numbered_patterns = [
-        # Pattern 1: Numbered citations (1. Author, 2. Author, etc.)
-        r"((?:^|\n)\s*\d+\.\s*.*?)(?=\n\s*\d+\.|\Z)",
-        # Pattern 2: Bracket numbered citations ([1] Author, [2] Author, etc.)
-        r"((?:^|\n)\s*\[\d+\]\s*.*?)(?=\n\s*\[\d+\]|\Z)",
-    ]
-    
-    for pattern in numbered_patterns:
-        matches = re.findall(pattern, reference_text, re.MULTILINE | re.DOTALL)
-        if len(matches) >= 3:  # Must find at least 3 citations to be valid
-            for match in matches:
-                # Clean up the citation by removing numbering and extra whitespace
-                clean = re.sub(r"^\s*[\d\[\]]+\.?\s*", "", match.strip())
-                clean = re.sub(r"\s+", " ", clean).strip()
-                
-                # Validate citation quality
-                if len(clean) >= 30 and re.search(r"\b(19|20)\d{2}\b", clean):
-                    citations.append(clean)
+    matches = _CITATION_SPLIT.findall(reference_text)
+    if len(matches) >= 3:  # Must find at least 3 citations to be valid
+        for match in matches:
+            # Strip the numbering in the same match that captures the
+            # payload, then collapse internal whitespace
+            m = _CITATION_CLEAN.match(match)
+            if not m:
+                continue
+            clean = " ".join(m.group(1).split())
             
-            if citations:
-                logger.info(f"Found {len(citations)} numbered citations")
-                return citations
+            # Validate citation quality
+            if len(clean) >= 30 and _YEAR_RE.search(clean):
+                citations.append(clean)
+        
+        if citations:
+            logger.info(f"Found {len(citations)} numbered citations")
+            return citations
     
     # Strategy 2: Fallback to author-year pattern
     # Look for lines that appear to be individual citations
@@ -230,10 +549,17 @@ def split_citations(reference_text: str) -> List[str]:
     
     for line in lines:
         line = line.strip()
+        # Cheap literal checks reject most non-citation lines before any
+        # regex runs: too short, no "Last, F" comma, or no "19"/"20" year
+        if len(line) < 30:
+            continue
+        if "," not in line:
+            continue
+        if "19" not in line and "20" not in line:
+            continue
         # Check if line looks like a citation (has author pattern and year)
-        if (len(line) >= 30 and 
-            re.search(r"[A-Z][a-z]+,\s*[A-Z]", line) and  # Author pattern
-            re.search(r"\b(19|20)\d{2}\b", line)):        # Year pattern
+        if (_AUTHOR_PATTERN.search(line) and  # Author pattern
+            _YEAR_RE.search(line)):           # Year pattern
             potential_citations.append(line)
     
     if potential_citations:
@@ -244,6 +570,7 @@ def split_citations(reference_text: str) -> List[str]:
     logger.warning("Using fallback strategy - returning all non-empty lines")
     return [ln.strip() for ln in lines if ln.strip()]
 
+@functools.lru_cache(maxsize=4096)
 def extract_citation_year(citation: str) -> Optional[str]:
     """
     Extract publication year from citation text.
@@ -263,20 +590,17 @@ def extract_citation_year(citation: str) -> Optional[str]:
         "2020"
         >>> extract_citation_year("Author, A. 2019; Title.")
         "2019"
+        
+    Note:
+        Results are memoized per citation string, like extract_doi_from_citation.
     """
     
-    # Year patterns in order of preference (most specific first)
-    year_patterns = [
-        # Pattern 1: Year in parentheses (2023)
-        r"\((\d{4})\)",
-        # Pattern 2: Year followed by punctuation (2023; or 2023,)
-        r"\b(\d{4})[;,.]",
-        # Pattern 3: Any 4-digit year in 1900-2099 range
-        r"\b(19|20)\d{2}\b",
-    ]
+    # Text without any digit cannot contain a year
+    if not _DIGIT_RE.search(citation):
+        return None
     
-    for pattern in year_patterns:
-        match = re.search(pattern, citation)
+    for pattern in _YEAR_PATTERNS:
+        match = pattern.search(citation)
         if match:
             # Extract the year value (group 1 if available, otherwise group 0)
             year = match.group(1) if match.lastindex else match.group(0)
@@ -340,12 +664,63 @@ def parse_citation(citation_text: str, citation_id: int) -> Dict:
     
     return citation
 
+# WordprocessingML element tags read when streaming document text
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_BODY = f"{_W_NS}body"
+_W_P = f"{_W_NS}p"
+_W_R = f"{_W_NS}r"
+_W_T = f"{_W_NS}t"
+_W_TAB = f"{_W_NS}tab"
+_W_BR = f"{_W_NS}br"
+_W_CR = f"{_W_NS}cr"
+_W_TYPE = f"{_W_NS}type"
+
+def iter_docx_paragraphs(docx_path: str) -> Iterator[str]:
+    """
+    Stream the text of each body paragraph in a Word document.
+    
+    Instead of building the full python-docx object graph, this reads
+    word/document.xml straight from the .docx ZIP archive with lxml
+    iterparse and yields paragraph text as each <w:p> element closes.
+    Processed elements are cleared so memory stays bounded on large files.
+    
+    Args:
+        docx_path (str): Path to the .docx file to read
+        
+    Yields:
+        str: Text of each top-level paragraph, in document order. Tabs and
+            line breaks are mapped to "\\t" and "\\n" as python-docx does.
+    """
+    with zipfile.ZipFile(docx_path) as archive, archive.open("word/document.xml") as xml_file:
+        for _, element in etree.iterparse(xml_file, tag=_W_P, resolve_entities=False):
+            parent = element.getparent()
+            
+            # Only body-level paragraphs, matching python-docx doc.paragraphs
+            if parent is not None and parent.tag == _W_BODY:
+                parts = []
+                for node in element.iter(_W_T, _W_TAB, _W_BR, _W_CR):
+                    # Skip tab stop definitions in paragraph properties
+                    if node.getparent().tag != _W_R:
+                        continue
+                    if node.tag == _W_T:
+                        parts.append(node.text or "")
+                    elif node.tag == _W_TAB:
+                        parts.append("\t")
+                    elif node.get(_W_TYPE) in (None, "textWrapping"):
+                        parts.append("\n")
+                yield "".join(parts)
+                
+                # Drop the paragraph and everything already read before it
+                element.clear()
+                while element.getprevious() is not None:
+                    del parent[0]
+
 def extract_citations_from_docx(docx_path: str) -> List[Dict]:
     """
     Extract citations from a Word document (.docx file).
     
     This is the main function that orchestrates the citation extraction process.
-    It reads the Word document, extracts the references section, splits it into
+    It streams the Word document text, extracts the references section, splits it into
     individual citations, and parses each citation into a structured format.
     
     Args:
@@ -365,15 +740,12 @@ def extract_citations_from_docx(docx_path: str) -> List[Dict]:
     try:
         logger.info(f"Starting citation extraction from: {docx_path}")
         
-        # Load the Word document
-        doc = Document(docx_path)
-        
-        # Extract all text from paragraphs (preserves structure)
-        full_text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
-        logger.debug(f"Extracted {len(full_text)} characters from document")
-        
-        # Step 1: Find and extract the references section
-        ref_section = extract_references_section(full_text)
+        # Step 1: Stream paragraphs and extract the references section
+        ref_section = extract_references_from_paragraphs(iter_docx_paragraphs(docx_path))
+        if ref_section is None:
+            # No usable heading: read the document again for the full-text
+            # fallback, which only this rare case has to hold in memory
+            ref_section = extract_references_section("\n".join(iter_docx_paragraphs(docx_path)))
         
         # Step 2: Split references section into individual citations
         citation_texts = split_citations(ref_section)
@@ -394,122 +766,354 @@ def extract_citations_from_docx(docx_path: str) -> List[Dict]:
             detail=f"Citation extraction failed: {str(e)}"
         )
 
+# Worker processes for parsing large documents, created on first use
+_PROCESS_POOL: Optional[ProcessPoolExecutor] = None
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    Return the shared worker process pool, creating it on first use.
+    
+    Workers are started with the "spawn" method so they do not inherit the
+    event loop, HTTP client or open file handles of the server process.
+    """
+    global _PROCESS_POOL
+    
+    if _PROCESS_POOL is None:
+        _PROCESS_POOL = ProcessPoolExecutor(
+            # Server workers each have a pool; together they use every core
+            max_workers=max(1, (os.cpu_count() or 1) // WEB_CONCURRENCY),
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _PROCESS_POOL
+
+def _extract_citations_in_process(docx_path: str) -> List[Dict]:
+    """
+    Run extract_citations_from_docx inside a worker process.
+    
+    HTTPException cannot be unpickled in the parent process, so failures are
+    re-raised as RuntimeError with the same message.
+    """
+    try:
+        return extract_citations_from_docx(docx_path)
+    except HTTPException as e:
+        raise RuntimeError(e.detail) from None
+
+async def extract_citations_async(docx_path: str) -> List[Dict]:
+    """
+    Extract citations without blocking the event loop.
+    
+    Document parsing is CPU-bound, so it runs in a worker thread. Documents
+    larger than PROCESS_POOL_MIN_BYTES are parsed in a separate process so
+    they do not hold the GIL while DOI lookups are running.
+    
+    Args:
+        docx_path (str): Path to the .docx file to process
+        
+    Returns:
+        List[Dict]: List of structured citation objects
+    """
+    if os.path.getsize(docx_path) > PROCESS_POOL_MIN_BYTES:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_process_pool(), _extract_citations_in_process, docx_path)
+    
+    return await asyncio.to_thread(extract_citations_from_docx, docx_path)
+
 # =============================================================================
 # EXTERNAL API CLIENTS
 # =============================================================================
 
-async def search_pubmed(query: str) -> Optional[Dict]:
+# Shared HTTP client for all PubMed and CrossRef requests. Reusing one pooled
+# client keeps TCP/TLS connections alive across every citation in a job
+# instead of paying a fresh handshake for each query.
+_HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+
+# Per-request timeouts: fail fast when a host is unreachable, and give up on
+# a stalled read without cancelling the surrounding lookup from outside.
+# rate_limited_get shortens them further to fit a lookup's time budget.
+_HTTP_TIMEOUT = httpx.Timeout(20.0, connect=5.0)
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the shared HTTP client, creating it on first use.
+    
+    Returns:
+        httpx.AsyncClient: Pooled client with SSL verification, timeout and
+            the polite User-Agent required by CrossRef
+    """
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None or _HTTP_CLIENT.is_closed:
+        _HTTP_CLIENT = httpx.AsyncClient(
+            timeout=_HTTP_TIMEOUT,
+            verify=certifi.where(),
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            http2=True,
+            headers={"User-Agent": "DOI-Finder/1.0 (mailto:admin@example.com)"}
+        )
+    return _HTTP_CLIENT
+
+# Per-host token buckets. PubMed allows 3 requests/second without an API key
+# (10 with one) and CrossRef's polite pool allows ~50 requests/second; the
+# CrossRef bucket keeps a little headroom below that. Concurrent lookups run
+# at the permitted rate instead of sleeping between calls. Every server worker
+# process has its own buckets, so each refills WEB_CONCURRENCY times slower
+# to keep the combined rate within the host's limit.
+_PUBMED_RL = AsyncLimiter(10 if NCBI_API_KEY else 3, WEB_CONCURRENCY)
+_CROSSREF_RL = AsyncLimiter(45, WEB_CONCURRENCY)
+
+# Retries for throttled (429) or temporarily unavailable (503) responses
+_API_MAX_RETRIES = 3
+_API_BACKOFF_BASE = 1.0   # Seconds before the first retry, doubled each time
+_API_BACKOFF_MAX = 30.0
+_API_RETRY_STATUS = (429, 503)
+
+async def rate_limited_get(limiter: AsyncLimiter, url: str, params: Dict,
+                           deadline: Optional[float] = None) -> httpx.Response:
+    """
+    GET a URL through the shared client under a per-host token bucket.
+    
+    Throttled (429) and unavailable (503) responses are retried with
+    exponential backoff, honouring a numeric Retry-After header when the
+    server sends one. Each attempt takes a fresh token from the bucket.
+    
+    Args:
+        limiter (AsyncLimiter): Token bucket of the target host
+        url (str): Request URL
+        params (Dict): Query parameters
+        deadline (Optional[float]): Event loop time by which the request must
+            be done; request timeouts are shortened to fit, and no retry is
+            attempted that would start after it
+        
+    Returns:
+        httpx.Response: The first non-retryable response, or the last one
+            once the retries (or the time before the deadline) are used up
+        
+    Raises:
+        httpx.TimeoutException: If a request times out or the deadline has
+            already passed
+    """
+    
+    loop = asyncio.get_running_loop()
+    client = get_http_client()
+    for attempt in range(_API_MAX_RETRIES + 1):
+        async with limiter:
+            timeout = _HTTP_TIMEOUT
+            if deadline is not None:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise httpx.TimeoutException(f"Lookup time budget used up before GET {url}")
+                timeout = httpx.Timeout(
+                    min(_HTTP_TIMEOUT.read, remaining),
+                    connect=min(_HTTP_TIMEOUT.connect, remaining)
+                )
+            response = await client.get(url, params=params, timeout=timeout)
+        
+        if response.status_code not in _API_RETRY_STATUS or attempt == _API_MAX_RETRIES:
+            return response
+        
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            delay = min(float(retry_after), _API_BACKOFF_MAX)
+        else:
+            delay = min(_API_BACKOFF_BASE * 2 ** attempt, _API_BACKOFF_MAX)
+        if deadline is not None and loop.time() + delay >= deadline:
+            # No time left for another attempt
+            return response
+        logger.info(f"{response.status_code} from {response.url.host}, retrying in {delay:.0f}s")
+        await asyncio.sleep(delay)
+    
+    return response
+
+# Extra parameters sent with every E-utilities request
+_NCBI_PARAMS = {"api_key": NCBI_API_KEY} if NCBI_API_KEY else {}
+
+# CrossRef fields read by search_crossref. Requesting only these keeps each
+# response to a few hundred bytes instead of full reference/affiliation trees.
+_CROSSREF_SELECT = "DOI,title,author,container-title,published-print,published-online"
+
+# Persistent cache of PubMed/CrossRef results keyed on the normalized query,
+# shared across jobs and restarts. Misses are stored as a sentinel so known
+# dead ends are not re-queried until LOOKUP_MISS_TTL expires.
+_LOOKUP_CACHE = diskcache.Cache(DOI_CACHE_DIR)
+_LOOKUP_MISS = {"miss": True}
+_QUERY_PUNCTUATION = re.compile(r"[^\w\s]")
+
+def lookup_cache_key(source: str, query: str) -> str:
+    """
+    Build the cache key for a search query.
+    
+    The query is lowercased, stripped of punctuation and whitespace-collapsed
+    before hashing, so trivially different renderings of the same citation
+    share one entry.
+    
+    Args:
+        source (str): Lookup source ("pubmed" or "crossref")
+        query (str): Search query sent to the source
+        
+    Returns:
+        str: Cache key for the query
+    """
+    normalized = " ".join(_QUERY_PUNCTUATION.sub(" ", query.lower()).split())
+    digest = hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+    return f"{source}:{digest}"
+
+def remember_lookup(key: str, result: Optional[Dict]) -> Optional[Dict]:
+    """
+    Store a search result (or a miss) in the lookup cache and return it.
+    
+    Args:
+        key (str): Cache key from lookup_cache_key
+        result (Optional[Dict]): Metadata found, or None for a miss
+        
+    Returns:
+        Optional[Dict]: The result that was passed in
+    """
+    if result is None:
+        _LOOKUP_CACHE.set(key, _LOOKUP_MISS, expire=LOOKUP_MISS_TTL)
+    else:
+        _LOOKUP_CACHE.set(key, result, expire=LOOKUP_CACHE_TTL)
+    return result
+
+@app.on_event("startup")
+async def open_http_client():
+    """Create the shared HTTP client when the application starts."""
+    get_http_client()
+
+@app.on_event("shutdown")
+async def close_http_client():
+    """Close the shared HTTP client and its pooled connections."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is not None:
+        await _HTTP_CLIENT.aclose()
+        _HTTP_CLIENT = None
+
+async def search_pubmed(query: str, deadline: Optional[float] = None) -> Optional[Dict]:
     """
     Search PubMed database for citation metadata using NCBI E-utilities API.
     
     This function performs a two-step search process:
     1. Search for PMIDs (PubMed IDs) matching the query
-    2. Fetch detailed metadata for the first result
+    2. Fetch the JSON document summary (esummary) for the first result,
+       which carries the DOI and citation fields without the full XML record
     
     Args:
         query (str): Search query (typically citation title or key phrases)
+        deadline (Optional[float]): Event loop time by which the search must
+            finish, passed to rate_limited_get
         
     Returns:
         Optional[Dict]: Citation metadata if found, None otherwise
             Contains keys: doi, title, authors, journal, year, source
         
+    Raises:
+        httpx.TimeoutException: If a request times out; other request
+            errors are logged and return None
+        
     Note:
         Uses NCBI E-utilities API with proper error handling and timeout.
-        Respects API rate limits with delays between requests.
+        Respects API rate limits through the shared PubMed token bucket.
+        Results and misses are cached; request errors are never cached.
     """
     
     # NCBI E-utilities API endpoints
     base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/"
     search_url = f"{base_url}esearch.fcgi"  # Search for PMIDs
-    fetch_url = f"{base_url}efetch.fcgi"    # Fetch metadata for PMIDs
+    summary_url = f"{base_url}esummary.fcgi"  # Fetch summaries for PMIDs
+    
+    # Answer repeated queries from the lookup cache
+    cache_key = lookup_cache_key("pubmed", query)
+    cached = _LOOKUP_CACHE.get(cache_key)
+    if cached is not None:
+        return None if cached.get("miss") else cached
     
     try:
-        # Create HTTP client with SSL verification and timeout
-        async with httpx.AsyncClient(timeout=30.0, verify=certifi.where()) as client:
-            
-            # Step 1: Search for PMIDs matching the query
-            search_params = {
-                "db": "pubmed",           # Search PubMed database
-                "term": query[:500],      # Limit query length to avoid URL issues
-                "retmode": "json",        # Return JSON format
-                "retmax": "5",            # Limit to 5 results for efficiency
-                "sort": "relevance"       # Sort by relevance
-            }
-            
-            search_response = await client.get(search_url, params=search_params)
-            search_response.raise_for_status()
-            search_data = search_response.json()
-            
-            # Extract PMIDs from search results
-            pmids = search_data.get("esearchresult", {}).get("idlist", [])
-            if not pmids:
-                logger.debug(f"No PMIDs found for query: {query[:100]}...")
-                return None
-            
-            # Step 2: Fetch detailed metadata for the first (most relevant) result
-            fetch_params = {
-                "db": "pubmed",
-                "id": pmids[0],          # Get details for first PMID
-                "retmode": "xml"         # XML format for detailed metadata
-            }
-            
-            fetch_response = await client.get(fetch_url, params=fetch_params)
-            fetch_response.raise_for_status()
-            
-            # Parse XML response to extract metadata
-            root = ET.fromstring(fetch_response.text)
-            
-            # Initialize metadata dictionary
-            metadata = {"source": "PubMed"}
-            
-            # Extract DOI from ArticleIdList (highest priority)
-            for article_id in root.findall(".//ArticleId"):
-                if article_id.get("IdType") == "doi":
-                    metadata["doi"] = article_id.text
-                    break
-            
-            # Extract title (truncate if too long)
-            title_elem = root.find(".//ArticleTitle")
-            if title_elem is not None and title_elem.text:
-                metadata["title"] = title_elem.text[:200]
-            
-            # Extract authors (limit to first 5 for brevity)
-            authors = []
-            for author in root.findall(".//Author")[:5]:
-                last_name = author.find("LastName")
-                first_name = author.find("ForeName")
-                if last_name is not None and last_name.text:
-                    name = last_name.text
-                    if first_name is not None and first_name.text:
-                        name += f", {first_name.text}"
-                    authors.append(name)
-            
-            if authors:
-                metadata["authors"] = "; ".join(authors)
-            
-            # Extract journal name
-            journal_elem = root.find(".//Journal/Title")
-            if journal_elem is not None and journal_elem.text:
-                metadata["journal"] = journal_elem.text[:100]
-            
-            # Extract publication year
-            year_elem = root.find(".//PubDate/Year")
-            if year_elem is not None and year_elem.text:
-                metadata["year"] = year_elem.text
-            
-            # Only return metadata if we found a DOI
-            if metadata.get("doi"):
-                logger.debug(f"PubMed found DOI: {metadata['doi']}")
-                return metadata
-            else:
-                logger.debug("PubMed found metadata but no DOI")
-                return None
-            
+        # Step 1: Search for PMIDs matching the query
+        search_params = {
+            "db": "pubmed",           # Search PubMed database
+            "term": query[:500],      # Limit query length to avoid URL issues
+            "retmode": "json",        # Return JSON format
+            "retmax": "5",            # Limit to 5 results for efficiency
+            "sort": "relevance",      # Sort by relevance
+            **_NCBI_PARAMS
+        }
+        
+        search_response = await rate_limited_get(_PUBMED_RL, search_url, search_params, deadline)
+        search_response.raise_for_status()
+        search_data = json_loads(search_response.content)
+        
+        # Extract PMIDs from search results
+        pmids = search_data.get("esearchresult", {}).get("idlist", [])
+        if not pmids:
+            logger.debug(f"No PMIDs found for query: {query[:100]}...")
+            return remember_lookup(cache_key, None)
+        
+        # Step 2: Fetch the summary for the first (most relevant) result
+        pmid = pmids[0]
+        summary_params = {
+            "db": "pubmed",
+            "id": pmid,              # Get summary for first PMID
+            "retmode": "json",       # JSON document summary
+            **_NCBI_PARAMS
+        }
+        
+        summary_response = await rate_limited_get(_PUBMED_RL, summary_url, summary_params, deadline)
+        summary_response.raise_for_status()
+        summary = json_loads(summary_response.content).get("result", {}).get(pmid, {})
+        
+        # Extract DOI from the article identifiers; without a DOI the rest of
+        # the metadata is not needed
+        doi = next(
+            (aid.get("value") for aid in summary.get("articleids", [])
+             if aid.get("idtype") == "doi" and aid.get("value")),
+            None
+        )
+        if not doi:
+            logger.debug("PubMed found metadata but no DOI")
+            return remember_lookup(cache_key, None)
+        
+        # Initialize metadata dictionary
+        metadata = {"source": "PubMed", "doi": doi}
+        
+        # Extract title (truncate if too long)
+        if summary.get("title"):
+            metadata["title"] = summary["title"][:200]
+        
+        # Extract authors (limit to first 5 for brevity). Summaries list
+        # authors as "Last AB"; convert to "Last, A B" so the formatters can
+        # build initials, and keep collective names unchanged.
+        authors = []
+        for author in summary.get("authors", [])[:5]:
+            name = author.get("name", "").strip()
+            if not name:
+                continue
+            last, _, initials = name.rpartition(" ")
+            if author.get("authtype") == "Author" and last and initials.isupper():
+                name = f"{last}, {' '.join(initials)}"
+            authors.append(name)
+        
+        if authors:
+            metadata["authors"] = "; ".join(authors)
+        
+        # Extract journal name
+        if summary.get("fulljournalname"):
+            metadata["journal"] = summary["fulljournalname"][:100]
+        
+        # Extract publication year ("2018 Jan 5" -> "2018")
+        year_match = _YEAR_RE.search(summary.get("pubdate", ""))
+        if year_match:
+            metadata["year"] = year_match.group(0)
+        
+        logger.debug(f"PubMed found DOI: {metadata['doi']}")
+        return remember_lookup(cache_key, metadata)
+        
+    except httpx.TimeoutException:
+        # Let the caller report a timeout rather than "no DOI found"
+        logger.warning(f"PubMed search timed out for query '{query[:100]}...'")
+        raise
     except Exception as e:
         logger.warning(f"PubMed search failed for query '{query[:100]}...': {e}")
         return None
 
-async def search_crossref(query: str) -> Optional[Dict]:
+async def search_crossref(query: str, deadline: Optional[float] = None) -> Optional[Dict]:
     """
     Search CrossRef database for citation metadata using their REST API.
     
@@ -519,121 +1123,178 @@ async def search_crossref(query: str) -> Optional[Dict]:
     
     Args:
         query (str): Search query (typically citation title or key phrases)
+        deadline (Optional[float]): Event loop time by which the search must
+            finish, passed to rate_limited_get
         
     Returns:
         Optional[Dict]: Citation metadata if found, None otherwise
             Contains keys: doi, title, authors, journal, year, source
         
+    Raises:
+        httpx.TimeoutException: If a request times out; other request
+            errors are logged and return None
+        
     Note:
-        Uses CrossRef REST API with proper headers and rate limiting.
+        Uses CrossRef REST API with proper headers and the shared CrossRef
+        token bucket for rate limiting.
         Includes required mailto parameter for polite API usage.
+        Results and misses are cached; request errors are never cached.
     """
     
     # CrossRef REST API endpoint
     base_url = "https://api.crossref.org/works"
     
+    # Answer repeated queries from the lookup cache
+    cache_key = lookup_cache_key("crossref", query)
+    cached = _LOOKUP_CACHE.get(cache_key)
+    if cached is not None:
+        return None if cached.get("miss") else cached
+    
     try:
-        # Create HTTP client with SSL verification and timeout
-        async with httpx.AsyncClient(timeout=30.0, verify=certifi.where()) as client:
-            
-            # Prepare search parameters
-            params = {
-                "query": query[:300],              # Limit query length
-                "rows": "5",                       # Limit results for efficiency
-                "mailto": "admin@example.com"     # Required for polite API usage
-            }
-            
-            # Required headers for CrossRef API
-            headers = {
-                "User-Agent": "DOI-Finder/1.0 (mailto:admin@example.com)"
-            }
-            
-            # Make API request
-            response = await client.get(base_url, params=params, headers=headers)
-            response.raise_for_status()
-            data = response.json()
-            
-            # Extract results from CrossRef response
-            items = data.get("message", {}).get("items", [])
-            if not items:
-                logger.debug(f"No CrossRef results found for query: {query[:100]}...")
-                return None
-            
-            # Process the first (most relevant) result
-            item = items[0]
-            metadata = {"source": "CrossRef"}
-            
-            # Extract DOI (primary goal)
-            doi = item.get("DOI")
-            if doi:
-                metadata["doi"] = doi
-            
-            # Extract title (may be a list, take first)
-            titles = item.get("title", [])
-            if titles and titles[0]:
-                metadata["title"] = titles[0][:200]
-            
-            # Extract authors (handle CrossRef author format)
-            authors = item.get("author", [])
-            if authors:
-                author_names = []
-                for author in authors[:5]:  # Limit to 5 authors for brevity
-                    given = author.get("given", "").strip()
-                    family = author.get("family", "").strip()
-                    if family:
-                        # Format as "Last, First" or just "Last"
-                        name = f"{family}, {given}" if given else family
-                        author_names.append(name)
-                
-                if author_names:
-                    metadata["authors"] = "; ".join(author_names)
-            
-            # Extract journal/container title
-            container_title = item.get("container-title", [])
-            if container_title and container_title[0]:
-                metadata["journal"] = container_title[0][:100]
-            
-            # Extract publication year (handle different date formats)
-            published = item.get("published-print") or item.get("published-online")
-            if published and "date-parts" in published:
-                try:
-                    # Extract year from date-parts array [year, month, day]
-                    year = published["date-parts"][0][0]
-                    metadata["year"] = str(year)
-                except (IndexError, TypeError):
-                    logger.debug("Could not extract year from CrossRef date")
-            
-            # Only return metadata if we found a DOI
-            if metadata.get("doi"):
-                logger.debug(f"CrossRef found DOI: {metadata['doi']}")
-                return metadata
-            else:
-                logger.debug("CrossRef found metadata but no DOI")
-                return None
+        # Prepare search parameters
+        params = {
+            "query.bibliographic": query[:300],  # Citation-aware query field
+            "rows": "1",                         # Only the top hit is used
+            "select": _CROSSREF_SELECT,          # Only the fields we extract
+            "mailto": "admin@example.com"       # Required for polite API usage
+        }
+        
+        # Make API request (the shared client sends the required User-Agent)
+        response = await rate_limited_get(_CROSSREF_RL, base_url, params, deadline)
+        response.raise_for_status()
+        data = json_loads(response.content)
+        
+        # Extract results from CrossRef response
+        items = data.get("message", {}).get("items", [])
+        if not items:
+            logger.debug(f"No CrossRef results found for query: {query[:100]}...")
+            return remember_lookup(cache_key, None)
+        
+        # Process the first (most relevant) result
+        item = items[0]
+        metadata = {"source": "CrossRef"}
+        
+        # Extract DOI (primary goal)
+        doi = item.get("DOI")
+        if doi:
+            metadata["doi"] = doi
+        
+        # Extract title (may be a list, take first)
+        titles = item.get("title", [])
+        if titles and titles[0]:
+            metadata["title"] = titles[0][:200]
+        
+        # Extract authors (handle CrossRef author format)
+        authors = item.get("author", [])
+        if authors:
+            author_names = []
+            for author in authors[:5]:  # Limit to 5 authors for brevity
+                given = author.get("given", "").strip()
+                family = author.get("family", "").strip()
+                if family:
+                    # Format as "Last, First" or just "Last"
+                    name = f"{family}, {given}" if given else family
+                    author_names.append(name)
             
+            if author_names:
+                metadata["authors"] = "; ".join(author_names)
+        
+        # Extract journal/container title
+        container_title = item.get("container-title", [])
+        if container_title and container_title[0]:
+            metadata["journal"] = container_title[0][:100]
+        
+        # Extract publication year (handle different date formats)
+        published = item.get("published-print") or item.get("published-online")
+        if published and "date-parts" in published:
+            try:
+                # Extract year from date-parts array [year, month, day]
+                year = published["date-parts"][0][0]
+                metadata["year"] = str(year)
+            except (IndexError, TypeError):
+                logger.debug("Could not extract year from CrossRef date")
+        
+        # Only return metadata if we found a DOI
+        if metadata.get("doi"):
+            logger.debug(f"CrossRef found DOI: {metadata['doi']}")
+            return remember_lookup(cache_key, metadata)
+        else:
+            logger.debug("CrossRef found metadata but no DOI")
+            return remember_lookup(cache_key, None)
+        
+    except httpx.TimeoutException:
+        # Let the caller report a timeout rather than "no DOI found"
+        logger.warning(f"CrossRef search timed out for query '{query[:100]}...'")
+        raise
     except Exception as e:
         logger.warning(f"CrossRef search failed for query '{query[:100]}...': {e}")
         return None
 
-async def lookup_citation_doi(citation: Dict) -> Dict:
+# Maximum number of citations looked up concurrently, shared by all jobs in
+# this process
+_LOOKUP_SEM = asyncio.Semaphore(MAX_CONCURRENT_LOOKUPS)
+
+# Search function and confidence score for each lookup source
+_LOOKUP_SOURCES = {
+    "PubMed": (search_pubmed, 0.9),    # High confidence for PubMed
+    "CrossRef": (search_crossref, 0.8),  # Good confidence for CrossRef
+}
+
+def classify_source(citation_text: str) -> str:
+    """
+    Guess which lookup source is most likely to resolve a citation.
+    
+    References naming a biomedical journal are routed to PubMed first,
+    while conference papers, books and preprints, which PubMed rarely
+    indexes, go to CrossRef. Everything else, including AMA-formatted
+    references from other fields, searches both.
+    
+    Args:
+        citation_text (str): Raw citation text
+        
+    Returns:
+        str: "pubmed_first", "crossref_first" or "both"
+        
+    Examples:
+        >>> classify_source("Smith J. Title. J Am Coll Cardiol. 2019;74(3):123-130.")
+        "pubmed_first"
+        >>> classify_source("Lee K. Title. In: Proceedings of the IEEE Conference. 2020.")
+        "crossref_first"
+    """
+    if _PUBMED_HINTS.search(citation_text):
+        return "pubmed_first"
+    if _CROSSREF_HINTS.search(citation_text):
+        return "crossref_first"
+    return "both"
+
+async def lookup_citation_doi(citation: Dict, use_crossref_fallback: bool = False,
+                              deadline: Optional[float] = None) -> Dict:
     """
     Look up DOI for a citation using multiple external sources.
     
     This function orchestrates the DOI lookup process by:
     1. Extracting searchable queries from the citation text
-    2. Searching PubMed database first (higher confidence)
-    3. Searching CrossRef database as fallback
+    2. Searching PubMed database first (higher confidence), unless the
+       citation looks like a proceedings/book reference (see classify_source)
+    3. Searching CrossRef database as fallback for unclassified citations,
+       and for biomedical ones only when use_crossref_fallback is set
     4. Updating citation with results and confidence scores
     
     Args:
         citation (Dict): Citation object to look up DOI for
+        use_crossref_fallback (bool): Whether to query CrossRef after PubMed
+            fails for citations routed to PubMed first (opt-in). Citations
+            routed to CrossRef first, or to both sources, always query it.
+        deadline (Optional[float]): Event loop time by which every search
+            for this citation must finish; searches that run out of time
+            are reported as a lookup timeout
         
     Returns:
         Dict: Updated citation object with DOI lookup results
         
     Note:
-        Includes rate limiting delays between API calls to respect
-        service limits and improve success rates.
+        Rate limiting is enforced per host inside search_pubmed and
+        search_crossref, so many lookups can safely run concurrently.
     """
     
     # Skip lookup if citation already has a DOI
@@ -644,21 +1305,30 @@ async def lookup_citation_doi(citation: Dict) -> Dict:
     original_text = citation["original"]
     logger.debug(f"Looking up DOI for citation {citation['id']}")
     
+    # Pick the sources to search and their order for this citation
+    route = classify_source(original_text)
+    if route == "crossref_first":
+        sources = ["CrossRef"]
+    elif route == "both" or use_crossref_fallback:
+        sources = ["PubMed", "CrossRef"]
+    else:
+        sources = ["PubMed"]
+    logger.debug(f"Citation {citation['id']} routed {route}: {', '.join(sources)}")
+    
+    # The same reference recurs across documents; reuse its earlier outcome
+    citation_key = lookup_cache_key("citation-" + "-".join(sources).lower(), original_text)
+    cached = _LOOKUP_CACHE.get(citation_key)
+    if cached is not None:
+        citation.update(cached)
+        logger.debug(f"Citation {citation['id']} answered from the lookup cache")
+        return citation
+    
     # Build search queries from citation text
     queries = []
     
     # Strategy 1: Extract potential title using various patterns
-    title_patterns = [
-        # Pattern 1: Text in quotes (often article titles)
-        r'"([^"]{10,})"',
-        # Pattern 2: Text after year (common in citations)
-        r'\d{4}[;,.]?\s*([A-Z][^.]{10,}?)\.',
-        # Pattern 3: Text after period (fallback)
-        r'\.?\s*([A-Z][^.]{10,}?)\.',
-    ]
-    
-    for pattern in title_patterns:
-        match = re.search(pattern, original_text)
+    for pattern in _TITLE_PATTERNS:
+        match = pattern.search(original_text)
         if match:
             potential_title = match.group(1).strip()
             # Validate title length (not too short, not too long)
@@ -670,55 +1340,60 @@ async def lookup_citation_doi(citation: Dict) -> Dict:
     # Strategy 2: Add full text as backup query (truncated)
     queries.append(original_text[:200])
     
-    # Search PubMed first (higher confidence results)
-    for query in queries:
-        if not query.strip():
-            continue
-        
-        logger.debug(f"Searching PubMed with query: {query[:50]}...")
-        result = await search_pubmed(query)
-        if result and result.get("doi"):
-            citation.update({
-                "status": "found",
-                "doi": result["doi"],
-                "confidence": 0.9,  # High confidence for PubMed
-                "metadata": result,
-                "source": "PubMed"
-            })
-            logger.info(f"Found DOI via PubMed: {result['doi']}")
-            return citation
-        
-        # Rate limiting: small delay between requests
-        await asyncio.sleep(0.5)
-    
-    # Search CrossRef as fallback
-    for query in queries:
-        if not query.strip():
-            continue
-        
-        logger.debug(f"Searching CrossRef with query: {query[:50]}...")
-        result = await search_crossref(query)
-        if result and result.get("doi"):
-            citation.update({
-                "status": "found",
-                "doi": result["doi"],
-                "confidence": 0.8,  # Good confidence for CrossRef
-                "metadata": result,
-                "source": "CrossRef"
-            })
-            logger.info(f"Found DOI via CrossRef: {result['doi']}")
-            return citation
-        
-        # Rate limiting: small delay between requests
-        await asyncio.sleep(0.5)
+    # Stop at the first source that returns a DOI; a search that times out
+    # moves on to the next query
+    timed_out = []
+    for source in sources:
+        search, confidence = _LOOKUP_SOURCES[source]
+        for query in queries:
+            if not query.strip():
+                continue
+            
+            logger.debug(f"Searching {source} with query: {query[:50]}...")
+            try:
+                result = await search(query, deadline)
+            except httpx.TimeoutException:
+                if source not in timed_out:
+                    timed_out.append(source)
+                continue
+            if result and result.get("doi"):
+                outcome = {
+                    "status": "found",
+                    "doi": result["doi"],
+                    "confidence": confidence,
+                    "metadata": result,
+                    "source": source
+                }
+                _LOOKUP_CACHE.set(citation_key, outcome, expire=LOOKUP_CACHE_TTL)
+                citation.update(outcome)
+                logger.info(f"Found DOI via {source}: {result['doi']}")
+                return citation
     
     # No DOI found in either source
-    citation.update({
+    if timed_out:
+        message = f"DOI lookup timeout ({' and '.join(timed_out)})"
+    else:
+        message = f"No DOI found in {' or '.join(sources)}"
+    outcome = {
         "status": "not_found",
         "confidence": 0.0,
-        "message": "No DOI found in PubMed or CrossRef"
-    })
-    logger.warning(f"No DOI found for citation {citation['id']}")
+        "message": message
+    }
+    citation.update(outcome)
+    logger.warning(f"{message} for citation {citation['id']}")
+    
+    # Searches that failed with a request error return None without caching
+    # an answer; only remember the miss when every search really came back
+    # empty
+    query_keys = [lookup_cache_key(source.lower(), query)
+                  for source in sources for query in queries if query.strip()]
+    if not timed_out and all(_LOOKUP_CACHE.get(key) is not None for key in query_keys):
+        _LOOKUP_CACHE.set(citation_key, outcome, expire=CITATION_MISS_TTL)
+        # The citation-level miss now stands in for the per-query misses;
+        # dropping them means the citation really is searched again once
+        # CITATION_MISS_TTL runs out, not after LOOKUP_MISS_TTL
+        for key in query_keys:
+            _LOOKUP_CACHE.delete(key)
     
     return citation
 
@@ -726,7 +1401,103 @@ async def lookup_citation_doi(citation: Dict) -> Dict:
 # CITATION FORMATTING FUNCTIONS
 # =============================================================================
 
-def format_citation_apa(metadata: Dict) -> str:
+# Literal fragments shared by the formatters and apply_dois_to_document
+_DOI_PREFIX = "https://doi.org/"
+_DOI_SCHEME = "doi:"
+_REFERENCES_HEADING = "References"
+
+# Metadata fields read by the citation formatters, in argument order
+_CITATION_FIELDS = ("authors", "year", "title", "journal", "volume", "issue", "pages", "doi")
+
+def _citation_fields(metadata: Mapping) -> tuple:
+    """Project citation metadata onto the hashable field tuple used as a cache key."""
+    return tuple(metadata.get(field) or "" for field in _CITATION_FIELDS)
+
+# One bit per citation field; a citation's field-presence mask selects its template
+_FIELD_BIT = {field: 1 << i for i, field in enumerate(_CITATION_FIELDS)}
+
+# format_map templates per field-presence mask, built on first use
+_APA_TEMPLATES: Dict[int, str] = {}
+_AMA_TEMPLATES: Dict[int, str] = {}
+
+def _field_mask(*values) -> int:
+    """Return the field-presence bitmask for values given in _CITATION_FIELDS order."""
+    mask = 0
+    for bit, value in enumerate(values):
+        if value:
+            mask |= 1 << bit
+    return mask
+
+def _apa_template(mask: int) -> str:
+    """
+    Return the APA format_map template for a field-presence mask.
+    
+    A bibliography uses only a handful of field combinations, so each
+    template is synthesized once and then every citation with the same
+    combination is a single C-level format_map call.
+    """
+    
+    template = _APA_TEMPLATES.get(mask)
+    if template is None:
+        parts = []
+        if mask & _FIELD_BIT["authors"]:
+            parts.append("{authors}")
+        if mask & _FIELD_BIT["year"]:
+            parts.append("({year}).")
+        if mask & _FIELD_BIT["title"]:
+            parts.append("{title}")
+        if mask & _FIELD_BIT["journal"]:
+            # Journal, Volume(Issue), pages.
+            journal = "*{journal}*"
+            if mask & _FIELD_BIT["volume"]:
+                journal += ", {volume}({issue})" if mask & _FIELD_BIT["issue"] else ", {volume}"
+            if mask & _FIELD_BIT["pages"]:
+                journal += ", {pages}"
+            parts.append(journal + ".")
+        if mask & _FIELD_BIT["doi"]:
+            parts.append("{doi}")
+        template = _APA_TEMPLATES[mask] = " ".join(parts)
+    return template
+
+def _ama_template(mask: int) -> str:
+    """Return the AMA format_map template for a field-presence mask (see _apa_template)."""
+    
+    template = _AMA_TEMPLATES.get(mask)
+    if template is None:
+        parts = []
+        if mask & _FIELD_BIT["authors"]:
+            parts.append("{authors}.")
+        if mask & _FIELD_BIT["title"]:
+            parts.append("{title}.")
+        if mask & _FIELD_BIT["journal"]:
+            parts.append("*{journal}*.")
+        if mask & _FIELD_BIT["year"]:
+            # Year;Volume(Issue):pages.
+            info = "{year}"
+            if mask & _FIELD_BIT["volume"]:
+                info += ";{volume}({issue})" if mask & _FIELD_BIT["issue"] else ";{volume}"
+                if mask & _FIELD_BIT["pages"]:
+                    info += ":{pages}"
+            parts.append(info + ".")
+        if mask & _FIELD_BIT["doi"]:
+            parts.append("doi:{doi}")
+        template = _AMA_TEMPLATES[mask] = " ".join(parts)
+    return template
+
+def _sentence_case(text: str) -> str:
+    """
+    Convert text to sentence case: first character upper, the rest lower.
+    
+    Proper nouns are lowercased too; the whole string is handled by two C
+    string calls rather than a per-word loop. Text that is already in
+    sentence case (common in CrossRef metadata) is returned as is.
+    """
+    text = text.strip()
+    if text[:1].isupper() and text[1:].islower():
+        return text
+    return text[:1].upper() + text[1:].lower()
+
+def format_citation_apa(metadata: Mapping) -> str:
     """
     Format citation metadata in APA (American Psychological Association) style.
     
@@ -734,7 +1505,7 @@ def format_citation_apa(metadata: Dict) -> str:
     This function creates a properly formatted citation string from metadata.
     
     Args:
-        metadata (Dict): Citation metadata containing authors, year, title, journal, volume, issue, pages, doi
+        metadata (Mapping): Citation metadata containing authors, year, title, journal, volume, issue, pages, doi
         
     Returns:
         str: Formatted citation in APA style
@@ -743,128 +1514,84 @@ def format_citation_apa(metadata: Dict) -> str:
         >>> metadata = {"authors": "Smith, J.", "year": "2020", "title": "Example", "journal": "Journal", "volume": "15", "issue": "3", "pages": "123-145", "doi": "10.1234/example"}
         >>> format_citation_apa(metadata)
         "Smith, J. (2020). Example. *Journal*, 15(3), 123-145. https://doi.org/10.1234/example"
+        
+    Note:
+        The work is done by _format_apa_cached, memoized on the eight
+        citation fields, so re-formatting a citation (preview, apply, style
+        toggles) is a cache lookup.
     """
     
-    parts = []
+    return _format_apa_cached(*_citation_fields(metadata))
+
+@functools.lru_cache(maxsize=4096)
+def _format_apa_cached(authors: str, year: str, title: str, journal: str,
+                       volume: str, issue: str, pages: str, doi: str) -> str:
+    """Build the APA citation string for format_citation_apa."""
+    
+    fields = {"year": year, "journal": journal, "volume": volume, "issue": issue, "pages": pages}
     
     # Authors - required component (format: Last, F. M., Last, F. M., & Last, F. M.)
-    authors = metadata.get("authors", "")
     if authors:
         # Format authors properly for APA style
         author_list = [a.strip() for a in authors.split(";")]
         formatted_authors = []
         
         for i, author in enumerate(author_list):
-            if "," in author:
+            last, sep, first = author.partition(",")
+            if sep:
                 # Format as "Last, First Middle" -> "Last, F. M."
-                last, first = author.split(",", 1)
-                first_parts = first.strip().split()
-                initials = " ".join([part[0] + "." for part in first_parts if part])
+                initials = " ".join(part[0] + "." for part in first.split())
                 formatted_authors.append(f"{last.strip()}, {initials}")
             else:
                 formatted_authors.append(author)
         
         # Join authors with commas and ampersand before last author
-        if len(formatted_authors) == 1:
-            parts.append(formatted_authors[0])
-        elif len(formatted_authors) == 2:
-            parts.append(f"{formatted_authors[0]} & {formatted_authors[1]}")
+        n = len(formatted_authors)
+        if n == 1:
+            fields["authors"] = formatted_authors[0]
+        elif n == 2:
+            fields["authors"] = f"{formatted_authors[0]} & {formatted_authors[1]}"
         else:
-            parts.append(", ".join(formatted_authors[:-1]) + f", & {formatted_authors[-1]}")
-    
-    # Year in parentheses with period - required component
-    year = metadata.get("year", "")
-    if year:
-        parts.append(f"({year}).")
+            formatted_authors[-1] = "& " + formatted_authors[-1]
+            fields["authors"] = ", ".join(formatted_authors)
     
     # Title - sentence case (only first word, first word after colon, and proper nouns capitalized)
-    title = metadata.get("title", "")
     if title:
         # Convert to proper sentence case for APA
         # Split by colon to handle subtitle capitalization
         if ':' in title:
             main_title, subtitle = title.split(':', 1)
-            # Process main title - convert to sentence case
-            main_words = main_title.split()
-            if main_words:
-                main_words[0] = main_words[0].capitalize()
-                for i, word in enumerate(main_words[1:], 1):
-                    # Convert to lowercase for sentence case (except proper nouns)
-                    # For now, convert all words to lowercase for proper sentence case
-                    main_words[i] = word.lower()
-            
-            # Process subtitle - capitalize first word, lowercase rest
-            subtitle_words = subtitle.split()
-            if subtitle_words:
-                subtitle_words[0] = subtitle_words[0].capitalize()
-                for i, word in enumerate(subtitle_words[1:], 1):
-                    # Convert to lowercase for sentence case (except proper nouns)
-                    # For now, convert all words to lowercase for proper sentence case
-                    subtitle_words[i] = word.lower()
-            
-            title_text = " ".join(main_words) + ": " + " ".join(subtitle_words)
+            title_text = f"{_sentence_case(main_title)}: {_sentence_case(subtitle)}"
         else:
             # No colon, process as single title
-            title_words = title.split()
-            if title_words:
-                title_words[0] = title_words[0].capitalize()
-                for i, word in enumerate(title_words[1:], 1):
-                    # Convert to lowercase for sentence case (except proper nouns)
-                    # For now, convert all words to lowercase for proper sentence case
-                    title_words[i] = word.lower()
-            title_text = " ".join(title_words)
-        
-        # Clean up any double periods and ensure only one period at the end
-        title_text = title_text.replace("..", ".")
-        # Remove any existing period at the end and add exactly one
-        title_text = title_text.rstrip('.') + "."
-        parts.append(title_text)
-    
-    # Journal name - italicized in APA style with volume, issue, and pages
-    journal = metadata.get("journal", "")
-    volume = metadata.get("volume", "")
-    issue = metadata.get("issue", "")
-    pages = metadata.get("pages", "")
-    
-    if journal:
-        # Journal name italicized (preserve original capitalization)
-        journal_part = f"*{journal}*"
-        
-        # Add volume and issue if available
-        if volume:
-            if issue:
-                journal_part += f", {volume}({issue})"
-            else:
-                journal_part += f", {volume}"
+            title_text = _sentence_case(title)
         
-        # Add pages if available
-        if pages:
-            journal_part += f", {pages}"
-        
-        parts.append(journal_part + ".")
+        # Remove any existing periods at the end and add exactly one
+        fields["title"] = title_text.rstrip('.') + "."
     
     # DOI as clickable link
-    doi = metadata.get("doi", "")
     if doi:
         # Ensure DOI has proper format
-        if not doi.startswith("https://doi.org/"):
-            if doi.startswith("doi:"):
-                doi = doi[4:]  # Remove "doi:" prefix
-            parts.append(f"https://doi.org/{doi}")
-        else:
-            parts.append(doi)
-    
-    # Join all parts with spaces and add final period, or return error message if incomplete
-    if parts:
-        citation = " ".join(parts)
-        # Ensure citation ends with a period
-        if not citation.endswith('.'):
-            citation += '.'
-        return citation
-    else:
+        doi = doi.removeprefix(_DOI_SCHEME)
+        if not doi.startswith(_DOI_PREFIX):
+            doi = _DOI_PREFIX + doi
+        # The DOI is always the last fragment, so it carries the final period
+        fields["doi"] = doi if doi.endswith(".") else doi + "."
+    
+    # Year, journal, volume, issue and pages are placed by the template
+    template = _apa_template(_field_mask(authors, year, title, journal, volume, issue, pages, doi))
+    
+    # Fill the template, or return error message if incomplete
+    if not template:
         return "Incomplete citation data"
+    
+    citation = template.format_map(fields)
+    # Every other fragment ends with a period; a lone author list may not
+    if template == "{authors}" and not citation.endswith('.'):
+        citation += '.'
+    return citation
 
-def format_citation_ama(metadata: Dict) -> str:
+def format_citation_ama(metadata: Mapping) -> str:
     """
     Format citation metadata in AMA (American Medical Association) style.
     
@@ -872,7 +1599,7 @@ def format_citation_ama(metadata: Dict) -> str:
     This function creates a properly formatted citation string from metadata.
     
     Args:
-        metadata (Dict): Citation metadata containing authors, year, title, journal, volume, issue, pages, doi
+        metadata (Mapping): Citation metadata containing authors, year, title, journal, volume, issue, pages, doi
         
     Returns:
         str: Formatted citation in AMA style
@@ -880,6 +1607,7 @@ def format_citation_ama(metadata: Dict) -> str:
     Note:
         AMA style uses abbreviated author names (Last F) and limits to 6 authors
         before adding "et al". Journal names are italicized and abbreviated.
+        Results are memoized on the citation fields by _format_ama_cached.
         
     Example:
         >>> metadata = {"authors": "Smith, John", "year": "2020", "title": "Example", "journal": "Journal", "volume": "15", "issue": "3", "pages": "123-145", "doi": "10.1234/example"}
@@ -887,10 +1615,16 @@ def format_citation_ama(metadata: Dict) -> str:
         "Smith J. Example. *Journal*. 2020;15(3):123-145. doi:10.1234/example"
     """
     
-    parts = []
+    return _format_ama_cached(*_citation_fields(metadata))
+
+@functools.lru_cache(maxsize=4096)
+def _format_ama_cached(authors: str, year: str, title: str, journal: str,
+                       volume: str, issue: str, pages: str, doi: str) -> str:
+    """Build the AMA citation string for format_citation_ama."""
+    
+    fields = {"year": year, "journal": journal, "volume": volume, "issue": issue, "pages": pages}
     
     # Authors in AMA format (Last F, Last F, et al) - up to 6 authors
-    authors = metadata.get("authors", "")
     if authors:
         # Split authors and convert to AMA format
         author_list = [a.strip() for a in authors.split(";")]
@@ -898,11 +1632,10 @@ def format_citation_ama(metadata: Dict) -> str:
         
         # Process up to 6 authors (AMA standard)
         for author in author_list[:6]:
-            if "," in author:
+            last, sep, first = author.partition(",")
+            if sep:
                 # Format as "Last, First Middle" -> "Last F"
-                last, first = author.split(",", 1)
-                first_parts = first.strip().split()
-                first_initial = first_parts[0][:1] if first_parts else ""
+                first_initial = first.lstrip()[:1]
                 ama_authors.append(f"{last.strip()} {first_initial}")
             else:
                 # Keep as-is if no comma found
@@ -912,61 +1645,114 @@ def format_citation_ama(metadata: Dict) -> str:
         if len(author_list) > 6:
             ama_authors.append("et al")
         
-        parts.append(", ".join(ama_authors) + ".")
+        fields["authors"] = ", ".join(ama_authors)
     
     # Title (not italicized in AMA, sentence case)
-    title = metadata.get("title", "")
     if title:
         # Convert to sentence case
         title_words = title.split()
         if title_words:
             title_words[0] = title_words[0].capitalize()
-        parts.append(" ".join(title_words) + ".")
+        fields["title"] = " ".join(title_words)
     
-    # Journal name (italicized and abbreviated)
-    journal = metadata.get("journal", "")
-    if journal:
-        # Basic journal abbreviation (in real implementation, would use a lookup table)
-        journal_abbrev = journal
-        parts.append(f"*{journal_abbrev}*.")
-    
-    # Year, volume, issue, and pages in AMA format: Year;Volume(Issue):pages
-    year = metadata.get("year", "")
-    volume = metadata.get("volume", "")
-    issue = metadata.get("issue", "")
-    pages = metadata.get("pages", "")
-    
-    if year:
-        citation_info = year
-        
-        if volume:
-            if issue:
-                citation_info += f";{volume}({issue})"
-            else:
-                citation_info += f";{volume}"
-            
-            if pages:
-                citation_info += f":{pages}"
-        
-        parts.append(citation_info + ".")
+    # Journal name is italicized by the template; a real implementation
+    # would abbreviate it from a lookup table first
     
     # DOI (AMA format: doi:DOI)
-    doi = metadata.get("doi", "")
     if doi:
         # Ensure DOI has proper format
-        if doi.startswith("https://doi.org/"):
-            doi = doi[16:]  # Remove "https://doi.org/" prefix
-        elif doi.startswith("doi:"):
-            doi = doi[4:]  # Remove "doi:" prefix
-        parts.append(f"doi:{doi}")
+        fields["doi"] = doi.removeprefix(_DOI_PREFIX).removeprefix(_DOI_SCHEME)
+    
+    # Year;Volume(Issue):pages and the other fields are placed by the template
+    template = _ama_template(_field_mask(authors, year, title, journal, volume, issue, pages, doi))
+    
+    # Fill the template, or return error message if incomplete
+    return template.format_map(fields) if template else "Incomplete citation data"
+
+# Cached builder behind format_citation_apa/ama for each supported style,
+# taking the projected field tuple; unknown styles fall back to AMA
+_CITATION_BUILDERS = {
+    "APA": _format_apa_cached,
+    "AMA": _format_ama_cached,
+}
+
+def format_citations_bulk(metadatas: List[Mapping], citation_style: str,
+                          pool: Optional[ProcessPoolExecutor] = None) -> List[str]:
+    """
+    Format a whole bibliography in one pass.
+    
+    Every metadata mapping is projected onto its field tuple once, each
+    distinct tuple is formatted once by the cached builder for the style,
+    and the results are fanned back out in input order. Duplicate entries
+    (common in merged or re-submitted bibliographies) cost a dict lookup.
+    
+    Args:
+        metadatas (List[Mapping]): Citation metadata, as for format_citation_apa
+        citation_style (str): Citation format ("APA" or "AMA"; others use AMA)
+        pool (Optional[ProcessPoolExecutor]): Worker processes to spread the
+            distinct citations over; formatted in-process when None
+        
+    Returns:
+        List[str]: Formatted citations in the same order as metadatas
+    """
+    
+    builder = _CITATION_BUILDERS.get(citation_style, _format_ama_cached)
+    rows = [_citation_fields(metadata) for metadata in metadatas]
+    distinct = list(set(rows))
     
-    # Join all parts with spaces, or return error message if incomplete
-    return " ".join(parts) if parts else "Incomplete citation data"
+    if pool is not None and distinct:
+        # Field tuples are sent to the workers column by column
+        chunksize = max(1, len(distinct) // (os.cpu_count() or 1))
+        texts = pool.map(builder, *zip(*distinct), chunksize=chunksize)
+    else:
+        texts = [builder(*row) for row in distinct]
+    
+    formatted = dict(zip(distinct, texts))
+    return [formatted[row] for row in rows]
 
 # =============================================================================
 # DOCUMENT PROCESSING FUNCTIONS
 # =============================================================================
 
+# Text node of a single-run paragraph, and the attribute keeping its spaces
+_W_RUN_TEXT = etree.XPath("./w:r/w:t", namespaces={"w": _W_NS[1:-1]})
+_XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
+def append_paragraphs(doc: Document, texts: List[str]) -> None:
+    """
+    Append plain-text paragraphs to the end of a document body.
+    
+    The first paragraph is created with python-docx and then used as a
+    prototype: each further paragraph is a deep copy of its <w:p> element
+    with the text swapped in, inserted right after the previous one. This
+    skips the per-call add_paragraph machinery for long reference lists.
+    
+    Args:
+        doc (Document): python-docx document to modify
+        texts (List[str]): Paragraph texts in order
+        
+    Note:
+        Texts containing tabs or line breaks need w:tab/w:br elements, so
+        they still go through add_paragraph, which appends at the same
+        position (before the final section properties).
+    """
+    
+    proto = None  # Single-run <w:p> element cloned for each paragraph
+    last = None   # Most recently appended <w:p> element
+    
+    for text in texts:
+        if proto is not None and "\t" not in text and "\n" not in text:
+            clone = copy.deepcopy(proto)
+            run_text = _W_RUN_TEXT(clone)[0]
+            run_text.text = text
+            run_text.set(_XML_SPACE, "preserve")
+            last.addnext(clone)
+            last = clone
+        else:
+            last = doc.add_paragraph(text)._element
+            if proto is None and len(_W_RUN_TEXT(last)) == 1:
+                proto = last
+
 def apply_dois_to_document(original_path: str, citations: List[Dict], 
                          apply_mode: str, citation_style: str) -> str:
     """
@@ -999,24 +1785,31 @@ def apply_dois_to_document(original_path: str, citations: List[Dict],
         
         # Load the original Word document
         doc = Document(original_path)
+        # python-docx rebuilds this list on every access, so read it once
+        paragraphs = doc.paragraphs
         
         # Step 1: Format accepted citations with DOIs
-        formatted_citations = []
+        ids = []
+        metadatas = []
         
         for citation in citations:
             # Only process citations that are accepted and have DOIs
-            if citation.get("accepted", False) and citation.get("doi"):
-                metadata = citation.get("metadata", {})
-                metadata["doi"] = citation["doi"]
-                
-                # Format citation according to selected style
-                if citation_style == "APA":
-                    formatted = format_citation_apa(metadata)
-                else:  # AMA
-                    formatted = format_citation_ama(metadata)
-                
-                # Add citation number and formatted text
-                formatted_citations.append(f"{citation['id']}. {formatted}")
+            doi = citation.get("doi")
+            if not (citation.get("accepted") and doi):
+                continue
+            
+            # Layer the DOI over the metadata without copying or modifying it
+            ids.append(citation["id"])
+            metadatas.append(ChainMap({"doi": doi}, citation.get("metadata", {})))
+        
+        # Large bibliographies can be formatted across the worker processes
+        if PARALLEL_FORMATTING and len(metadatas) > PARALLEL_FORMAT_MIN_CITATIONS:
+            formatted = format_citations_bulk(metadatas, citation_style, get_process_pool())
+        else:
+            formatted = format_citations_bulk(metadatas, citation_style)
+        
+        # Add citation number and formatted text
+        formatted_citations = [f"{cid}. {text}" for cid, text in zip(ids, formatted)]
         
         if not formatted_citations:
             raise ValueError("No citations selected for application")
@@ -1025,45 +1818,43 @@ def apply_dois_to_document(original_path: str, citations: List[Dict],
         if apply_mode == "append_new_section":
             # Safe mode: Add new references section at the end
             logger.info("Adding new references section")
-            doc.add_heading('References', level=1)
-            for formatted_citation in formatted_citations:
-                doc.add_paragraph(formatted_citation)
+            doc.add_heading(_REFERENCES_HEADING, level=1)
+            append_paragraphs(doc, formatted_citations)
         
         elif apply_mode == "replace_references":
             # Advanced mode: Replace existing references section
             logger.info("Replacing existing references section")
             
             # Find the start of the references section
-            ref_start = -1
-            for i, paragraph in enumerate(doc.paragraphs):
-                if re.search(r"(?i)^\s*(references?|bibliography)\s*$", paragraph.text.strip()):
-                    ref_start = i
-                    break
+            ref_start = next(
+                (i for i, paragraph in enumerate(paragraphs)
+                 if _REF_HEADING.match(paragraph.text.strip())),
+                -1
+            )
             
             if ref_start >= 0:
                 # Remove existing references content
-                paragraphs_to_remove = []
-                for i in range(ref_start + 1, len(doc.paragraphs)):
-                    if (doc.paragraphs[i].text.strip() and 
-                        not re.search(r"(?i)^\s*(appendix|acknowledgment)", doc.paragraphs[i].text)):
-                        paragraphs_to_remove.append(i)
+                elements_to_remove = []
+                for paragraph in islice(paragraphs, ref_start + 1, None):
+                    if (paragraph.text.strip() and 
+                        not _REF_STOP_RE.match(paragraph.text)):
+                        elements_to_remove.append(paragraph._element)
                     else:
                         break
                 
-                # Remove paragraphs in reverse order to maintain indices
-                for i in reversed(paragraphs_to_remove):
-                    p = doc.paragraphs[i]._element
-                    p.getparent().remove(p)
+                # lxml removes by identity, so the order does not matter
+                for el in elements_to_remove:
+                    parent = el.getparent()
+                    if parent is not None:
+                        parent.remove(el)
                 
                 # Add new formatted citations
-                for formatted_citation in formatted_citations:
-                    doc.add_paragraph(formatted_citation)
+                append_paragraphs(doc, formatted_citations)
             else:
                 # Fallback: append new section if no references found
                 logger.warning("No existing references section found, appending new section")
-                doc.add_heading('References', level=1)
-                for formatted_citation in formatted_citations:
-                    doc.add_paragraph(formatted_citation)
+                doc.add_heading(_REFERENCES_HEADING, level=1)
+                append_paragraphs(doc, formatted_citations)
         
         # Step 3: Save the modified document
         output_path = original_path.replace(".docx", "_with_dois.docx")
@@ -1079,6 +1870,200 @@ def apply_dois_to_document(original_path: str, citations: List[Dict],
             detail=f"Document processing failed: {str(e)}"
         )
 
+# =============================================================================
+# BACKGROUND JOB QUEUE
+# =============================================================================
+
+# Number of documents processed at the same time. Further uploads wait in the
+# queue, so a burst of uploads cannot swamp the event loop or the APIs.
+MAX_CONCURRENT_JOBS = int(os.environ.get("MAX_CONCURRENT_JOBS", "2"))
+
+# Hard limit for a single job, enforced by process_document; lookups still
+# running when it (or the 10 minute lookup budget) runs out are cut short
+# and the job completes with the results found so far
+JOB_TIME_LIMIT = int(os.environ.get("JOB_TIME_LIMIT", str(15 * 60)))
+
+# Job claims expire this many seconds after their last heartbeat, so jobs
+# held by a crashed process become available again soon after
+JOB_CLAIM_TTL = 60
+
+_JOB_QUEUE: Optional[asyncio.Queue] = None
+_JOB_WORKERS: List[asyncio.Task] = []
+
+async def keep_job_claimed(job_id: str):
+    """Refresh this process's claim on a job until cancelled."""
+    while True:
+        await asyncio.sleep(JOB_CLAIM_TTL / 3)
+        if not jobs.refresh_claim(job_id, JOB_CLAIM_TTL):
+            logger.warning(f"Lost the claim on job {job_id}")
+            return
+
+async def job_worker(worker_id: int):
+    """
+    Process queued jobs one at a time until cancelled.
+    
+    The claim on a job is released when processing ends for any reason,
+    including cancellation at shutdown, so an interrupted job can be picked
+    up again as soon as the server restarts.
+    
+    Args:
+        worker_id (int): Worker number, used for logging only
+    """
+    while True:
+        job_id = await _JOB_QUEUE.get()
+        claimed = False
+        heartbeat = None
+        try:
+            # Another worker process may already own this job
+            if not jobs.claim(job_id, JOB_CLAIM_TTL):
+                logger.info(f"Worker {worker_id} skipped job {job_id}, claimed elsewhere")
+                continue
+            claimed = True
+            
+            # Recovery can queue a job twice; the second copy finds it done
+            job = jobs.get_summary(job_id)
+            if job is None or job["status"] not in ("uploaded", "processing"):
+                continue
+            
+            heartbeat = asyncio.create_task(keep_job_claimed(job_id))
+            logger.info(f"Worker {worker_id} picked up job {job_id}")
+            await process_document(job_id)
+        except Exception as e:
+            logger.error(f"Worker {worker_id} failed on job {job_id}: {e}")
+        finally:
+            if heartbeat is not None:
+                heartbeat.cancel()
+            if claimed:
+                jobs.release(job_id)
+            _JOB_QUEUE.task_done()
+
+def start_job_workers():
+    """Create the job queue and its worker tasks if they are not running."""
+    global _JOB_QUEUE
+    if _JOB_QUEUE is None:
+        _JOB_QUEUE = asyncio.Queue()
+    if not _JOB_WORKERS:
+        for worker_id in range(MAX_CONCURRENT_JOBS):
+            _JOB_WORKERS.append(asyncio.create_task(job_worker(worker_id)))
+
+def enqueue_job(job_id: str):
+    """
+    Queue a job for background processing and return immediately.
+    
+    Args:
+        job_id (str): Unique job identifier
+    """
+    start_job_workers()
+    _JOB_QUEUE.put_nowait(job_id)
+    logger.info(f"Queued job {job_id} ({_JOB_QUEUE.qsize()} waiting)")
+
+_REAPER_TASK: Optional[asyncio.Task] = None
+
+# Names of the documents this app writes to TEMP_DIR (upload_file and
+# apply_dois_to_document); nothing else in the directory is ever touched
+_TEMP_DOC_NAME = re.compile(r"[0-9a-f]{32}(?:_with_dois)?\.docx")
+
+def reap_expired_jobs() -> int:
+    """
+    Purge expired job records and delete documents no live job refers to.
+    
+    Job records expire from the store on their own, but their uploaded and
+    generated .docx files stay in TEMP_DIR. A document the app created
+    (see _TEMP_DOC_NAME) is deleted once no job record references it; since saving a job extends its lifetime, files
+    are matched against the records rather than aged by mtime. Files newer
+    than REAPER_INTERVAL are left alone, as an upload is written before
+    its job record.
+    
+    Returns:
+        int: Number of files deleted
+    """
+    jobs.expire()
+    referenced = jobs.referenced_files()
+    
+    removed = 0
+    cutoff = datetime.now().timestamp() - REAPER_INTERVAL
+    try:
+        entries = list(os.scandir(TEMP_DIR))
+    except FileNotFoundError:
+        return 0
+    
+    for entry in entries:
+        try:
+            if (_TEMP_DOC_NAME.fullmatch(entry.name) and entry.is_file()
+                    and entry.stat().st_mtime < cutoff
+                    and os.path.realpath(entry.path) not in referenced):
+                os.remove(entry.path)
+                removed += 1
+        except OSError:
+            # Already removed by another worker process
+            continue
+    return removed
+
+async def requeue_unfinished_jobs():
+    """
+    Queue jobs that are unfinished but not claimed by any live process.
+    
+    This covers jobs interrupted by a shutdown (their claim was released)
+    and jobs of a process that died (their claim expired without a
+    heartbeat).
+    """
+    for job_id in await asyncio.to_thread(jobs.unfinished):
+        if not jobs.is_claimed(job_id):
+            enqueue_job(job_id)
+
+async def job_reaper():
+    """
+    Recover orphaned jobs and run reap_expired_jobs every REAPER_INTERVAL
+    seconds until cancelled.
+    """
+    # Claims left by a crashed previous run expire within JOB_CLAIM_TTL
+    await asyncio.sleep(JOB_CLAIM_TTL)
+    while True:
+        try:
+            await requeue_unfinished_jobs()
+            removed = await asyncio.to_thread(reap_expired_jobs)
+            if removed:
+                logger.info(f"Reaper removed {removed} expired document(s)")
+        except Exception as e:
+            logger.error(f"Reaper sweep failed: {e}")
+        await asyncio.sleep(REAPER_INTERVAL)
+
+@app.on_event("startup")
+async def open_job_queue():
+    """
+    Start the background job workers when the application starts.
+    
+    Jobs left queued or half-processed by a previous run are queued again;
+    the claim taken by job_worker keeps them from running twice when
+    several worker processes start together.
+    """
+    global _REAPER_TASK
+    start_job_workers()
+    await requeue_unfinished_jobs()
+    
+    # Recover orphaned jobs and sweep expired ones in the background
+    _REAPER_TASK = asyncio.create_task(job_reaper())
+
+@app.on_event("shutdown")
+async def close_job_queue():
+    """Cancel the background job workers, reaper and parsing processes on shutdown."""
+    global _JOB_QUEUE, _PROCESS_POOL, _REAPER_TASK
+    for task in _JOB_WORKERS:
+        task.cancel()
+    await asyncio.gather(*_JOB_WORKERS, return_exceptions=True)
+    _JOB_WORKERS.clear()
+    _JOB_QUEUE = None
+    
+    if _REAPER_TASK is not None:
+        _REAPER_TASK.cancel()
+        await asyncio.gather(_REAPER_TASK, return_exceptions=True)
+        _REAPER_TASK = None
+    
+    # Stop the document parsing processes as well
+    if _PROCESS_POOL is not None:
+        _PROCESS_POOL.shutdown(cancel_futures=True)
+        _PROCESS_POOL = None
+
 # =============================================================================
 # FASTAPI ROUTES & API ENDPOINTS
 # =============================================================================
@@ -1099,6 +2084,43 @@ async def index(request: Request):
     """
     return templates.TemplateResponse("upload.html", {"request": request})
 
+# Local file header signature that every ZIP (and so every .docx) starts with
+_ZIP_MAGIC = b"PK\x03\x04"
+
+def is_docx_package(path: str) -> bool:
+    """
+    Check that a file is a Word OOXML package rather than just named like one.
+    
+    Args:
+        path (str): Path to the uploaded file
+        
+    Returns:
+        bool: True if the file is a ZIP archive containing word/document.xml
+    """
+    try:
+        with zipfile.ZipFile(path) as package:
+            return "word/document.xml" in package.namelist()
+    except (zipfile.BadZipFile, OSError):
+        return False
+
+def upload_display_name(filename: str) -> str:
+    """
+    Reduce a client-supplied filename to a safe display name.
+    
+    Any directory part (with either separator) is dropped and control
+    characters are removed, so the name can be echoed back in
+    Content-Disposition headers without leaking or traversing paths.
+    
+    Args:
+        filename (str): Filename as sent by the client
+        
+    Returns:
+        str: Bare file name, or "document.docx" if nothing usable is left
+    """
+    name = os.path.basename(filename.replace("\\", "/"))
+    name = "".join(ch for ch in name if ch.isprintable()).strip()
+    return name if name not in ("", ".docx") else "document.docx"
+
 @app.post("/upload")
 async def upload_file(file: UploadFile = File(...), citation_format: str = Form("APA")):
     """
@@ -1119,8 +2141,8 @@ async def upload_file(file: UploadFile = File(...), citation_format: str = Form(
         HTTPException: If file validation fails or upload errors occur
         
     Note:
-        Processing happens asynchronously in the background. The client
-        should poll the job status endpoint to check progress.
+        Processing happens asynchronously in the background job queue. The
+        client should poll the job status endpoint to check progress.
     """
     
     # Validate uploaded file
@@ -1132,30 +2154,69 @@ async def upload_file(file: UploadFile = File(...), citation_format: str = Form(
     
     if file.size and file.size > MAX_UPLOAD_BYTES:
         raise HTTPException(
-            status_code=400, 
+            status_code=413, 
             detail=f"File too large. Max size: {MAX_UPLOAD_BYTES // (1024*1024)}MB"
         )
     
+    # Reject non-ZIP content before anything is written to disk
+    head = await file.read(len(_ZIP_MAGIC))
+    if head != _ZIP_MAGIC:
+        raise HTTPException(
+            status_code=400, 
+            detail="Only .docx files are supported"
+        )
+    await file.seek(0)
+    
     # Generate unique job identifier
     job_id = str(uuid.uuid4())
     
-    # Ensure temp directory exists and save uploaded file
-    os.makedirs("temp", exist_ok=True)
-    file_path = f"temp/{job_id}_{file.filename}"
+    # Store under a server-generated name; the client's filename is only
+    # kept (sanitized) in the job record for the download name
+    filename = upload_display_name(file.filename)
+    os.makedirs(TEMP_DIR, exist_ok=True)
+    temp_root = os.path.realpath(TEMP_DIR)
+    file_path = os.path.join(temp_root, f"{uuid.uuid4().hex}.docx")
+    if os.path.dirname(os.path.realpath(file_path)) != temp_root:
+        raise HTTPException(status_code=400, detail="Invalid upload path")
     
     try:
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        # Copy in chunks, enforcing the size limit even without file.size
+        total = 0
+        # Write without blocking the event loop on disk I/O
+        async with aiofiles.open(file_path, "wb") as buffer:
+            while chunk := await file.read(UPLOAD_CHUNK_BYTES):
+                total += len(chunk)
+                if total > MAX_UPLOAD_BYTES:
+                    raise HTTPException(
+                        status_code=413, 
+                        detail=f"File too large. Max size: {MAX_UPLOAD_BYTES // (1024*1024)}MB"
+                    )
+                await buffer.write(chunk)
     except Exception as e:
+        # Never leave a partial upload behind to fill the disk
+        try:
+            os.remove(file_path)
+        except OSError:
+            pass
+        if isinstance(e, HTTPException):
+            raise
         raise HTTPException(
             status_code=500, 
             detail=f"File upload failed: {str(e)}"
         )
     
+    # The signature only says ZIP; make sure it is actually a Word document
+    if not await asyncio.to_thread(is_docx_package, file_path):
+        os.remove(file_path)
+        raise HTTPException(
+            status_code=400, 
+            detail="Only .docx files are supported"
+        )
+    
     # Create job record for tracking
     jobs[job_id] = {
         "id": job_id,
-        "filename": file.filename,
+        "filename": filename,
         "filepath": file_path,
         "status": "uploaded",
         "citation_format": citation_format,
@@ -1163,10 +2224,10 @@ async def upload_file(file: UploadFile = File(...), citation_format: str = Form(
         "citations": []
     }
     
-    logger.info(f"File uploaded successfully: {file.filename} (Job: {job_id})")
+    logger.info(f"File uploaded successfully: {filename} (Job: {job_id})")
     
-    # Start background processing task
-    asyncio.create_task(process_document(job_id))
+    # Queue the job for the background workers
+    enqueue_job(job_id)
     
     return {
         "job_id": job_id, 
@@ -1193,12 +2254,81 @@ async def process_status(job_id: str):
         HTTPException: If job ID is not found
     """
     
-    if job_id not in jobs:
+    # Status polls do not need the citations, so read only the summary
+    job = jobs.get_summary(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    job = jobs[job_id]
     return {"status": job["status"], "progress": job.get("progress", 0)}
 
+@app.get("/events/{job_id}")
+async def job_events(job_id: str):
+    """
+    Stream job progress to the browser as Server-Sent Events.
+    
+    Instead of the client polling every few seconds, one long-lived response
+    pushes an event whenever the job's status or progress changes, and ends
+    once the job has completed or failed.
+    
+    Args:
+        job_id (str): Unique job identifier
+        
+    Returns:
+        StreamingResponse: text/event-stream of JSON objects with status,
+            progress, processed, total and error
+        
+    Raises:
+        HTTPException: If job ID is not found
+        
+    Note:
+        The job may be processed by another worker process, so changes are
+        picked up by re-reading the job summary from the shared store every
+        JOB_EVENT_INTERVAL seconds rather than through in-process signals.
+    """
+    
+    if jobs.get_summary(job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    async def event_stream():
+        last_event = None
+        idle = 0.0
+        
+        while True:
+            job = jobs.get_summary(job_id)
+            if job is None:
+                # Expired or removed while streaming
+                yield f"data: {json_dumps({'status': 'error', 'error': 'Job not found'})}\n\n"
+                return
+            
+            event = {
+                "status": job["status"],
+                "progress": job.get("progress", 0),
+                "processed": job.get("processed_citations", 0),
+                "total": job.get("total_citations", 0),
+                "error": job.get("error"),
+            }
+            
+            if event != last_event:
+                yield f"data: {json_dumps(event)}\n\n"
+                last_event = event
+                idle = 0.0
+            elif idle >= JOB_EVENT_KEEPALIVE:
+                # Comment line keeps proxies from closing an idle stream
+                yield ": keepalive\n\n"
+                idle = 0.0
+            
+            if job["status"] in ("completed", "error"):
+                return
+            
+            await asyncio.sleep(JOB_EVENT_INTERVAL)
+            idle += JOB_EVENT_INTERVAL
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 async def process_document(job_id: str):
     """
     Extended background task to process ALL citations completely.
@@ -1211,78 +2341,131 @@ async def process_document(job_id: str):
         job_id (str): Unique job identifier for tracking progress
         
     Note:
-        This function updates the job status and progress in real-time,
-        allowing the frontend to display progress updates to users.
+        This function saves the job status and progress to the job store as
+        it goes, allowing the frontend to display progress updates to users.
         Includes extended timeouts to handle large documents completely.
+        The job as a whole is bounded by JOB_TIME_LIMIT: lookups still
+        running at the deadline are marked "Processing timeout" and the
+        citations resolved so far are kept.
     """
     
+    job = jobs.get(job_id)
+    if job is None:
+        logger.error(f"Job {job_id} no longer exists, skipping processing")
+        return
+    
+    # Monotonic clock, unaffected by system clock changes
+    loop = asyncio.get_running_loop()
+    job_deadline = loop.time() + JOB_TIME_LIMIT
+    
     try:
-        job = jobs[job_id]
         job["status"] = "processing"
         job["progress"] = 10
+        jobs.save(job)
         
         # Extract citations
         logger.info(f"Starting citation extraction for job {job_id}")
-        citations = extract_citations_from_docx(job["filepath"])
+        citations = await asyncio.wait_for(
+            extract_citations_async(job["filepath"]),
+            timeout=JOB_TIME_LIMIT
+        )
+        total_citations = len(citations)
+        
+        # Citations that already carry a DOI need no network lookup
+        to_lookup = [
+            (i, citation) for i, citation in enumerate(citations)
+            if citation["status"] != "has_doi" and not citation.get("doi")
+        ]
+        existing_dois = total_citations - len(to_lookup)
+        
         job["citations"] = citations
         job["progress"] = 30
+        job["processed_citations"] = existing_dois
+        job["total_citations"] = total_citations
+        jobs.save(job)
         
-        total_citations = len(citations)
-        logger.info(f"Found {total_citations} citations to process for job {job_id}")
+        logger.info(f"Found {total_citations} citations for job {job_id}, {existing_dois} already with DOIs")
         
-        # Look up DOIs for each citation with EXTENDED processing
-        processed = 0
+        # Look up DOIs for each remaining citation with EXTENDED processing
+        processed = existing_dois
         successful_lookups = 0
         
-        # EXTENDED timeout for complete processing - 10 minutes total
-        start_time = datetime.now()
+        # EXTENDED timeout for complete processing - 10 minutes total, and
+        # never past the job's own time limit
+        start_time = loop.time()
         timeout_minutes = 10
+        deadline = min(start_time + timeout_minutes * 60, job_deadline)
+        last_progress_save = start_time
         
-        for i, citation in enumerate(citations):
-            # Check timeout but allow more generous time
-            elapsed_minutes = (datetime.now() - start_time).seconds / 60
-            if elapsed_minutes > timeout_minutes:
-                logger.warning(f"Extended timeout reached for job {job_id} after {elapsed_minutes:.1f} minutes")
-                # Mark remaining citations as not found
-                for remaining_citation in citations[processed:]:
-                    remaining_citation["status"] = "not_found"
-                    remaining_citation["confidence"] = 0.0
-                    remaining_citation["message"] = "Processing timeout"
-                break
+        async def lookup_one(i: int, citation: Dict):
+            nonlocal processed, successful_lookups, last_progress_save
             
-            try:
-                logger.info(f"Looking up DOI for citation {i+1}/{total_citations} in job {job_id}")
-                
-                # Extended timeout per citation - 45 seconds
-                await asyncio.wait_for(
-                    lookup_citation_doi(citation), 
-                    timeout=45.0
-                )
-                
-                if citation.get("doi"):
-                    successful_lookups += 1
-                    logger.info(f"Successfully found DOI for citation {i+1}: {citation['doi']}")
+            # Bound the number of in-flight lookups; the per-citation timeout
+            # only starts once a slot is acquired
+            async with _LOOKUP_SEM:
+                # Check timeout but allow more generous time
+                if loop.time() > deadline:
+                    logger.warning(f"Extended timeout reached for job {job_id}, skipping citation {i+1}")
+                    # Mark remaining citations as not found
+                    citation["status"] = "not_found"
+                    citation["confidence"] = 0.0
+                    citation["message"] = "Processing timeout"
+                    return
                 
-            except asyncio.TimeoutError:
-                citation["status"] = "not_found"
-                citation["confidence"] = 0.0
-                citation["message"] = "DOI lookup timeout (45s)"
-                logger.warning(f"Timeout on citation {i+1} for job {job_id}")
-                
-            except Exception as e:
-                citation["status"] = "not_found"
-                citation["confidence"] = 0.0
-                citation["message"] = f"Lookup error: {str(e)}"
-                logger.error(f"Error on citation {i+1} for job {job_id}: {e}")
+                try:
+                    logger.info(f"Looking up DOI for citation {i+1}/{total_citations} in job {job_id}")
+                    
+                    # Each citation gets LOOKUP_TIME_LIMIT for all of its
+                    # searches, retries and backoff waits, and never runs past
+                    # the job deadline. The budget is enforced through the
+                    # HTTP client's request timeouts, so no request is
+                    # cancelled from outside.
+                    lookup_deadline = min(loop.time() + LOOKUP_TIME_LIMIT, deadline)
+                    await lookup_citation_doi(citation, CROSSREF_FALLBACK, lookup_deadline)
+                    
+                    if (lookup_deadline == deadline and citation["status"] == "not_found"
+                            and citation.get("message", "").startswith("DOI lookup timeout")):
+                        citation["message"] = "Processing timeout"
+                        logger.warning(f"Extended timeout reached for job {job_id} during citation {i+1}")
+                    
+                    if citation.get("doi"):
+                        successful_lookups += 1
+                        logger.info(f"Successfully found DOI for citation {i+1}: {citation['doi']}")
+                    
+                except Exception as e:
+                    citation["status"] = "not_found"
+                    citation["confidence"] = 0.0
+                    citation["message"] = f"Lookup error: {str(e)}"
+                    logger.error(f"Error on citation {i+1} for job {job_id}: {e}")
             
             processed += 1
             progress_percent = 30 + ((processed / total_citations) * 65)
             job["progress"] = min(95, progress_percent)
+            job["processed_citations"] = processed
+            # Citations are written once at the end; progress touches only the
+            # summary, and only every few citations or fractions of a second
+            now = loop.time()
+            if (processed % PROGRESS_SAVE_EVERY == 0
+                    or now - last_progress_save >= PROGRESS_SAVE_INTERVAL
+                    or processed == total_citations):
+                jobs.save_progress(job)
+                last_progress_save = now
             
             # Log detailed progress every 5 citations
             if processed % 5 == 0 or processed == total_citations:
                 logger.info(f"Job {job_id} progress: {processed}/{total_citations} citations processed, {successful_lookups} DOIs found")
         
+        # Run lookups concurrently; per-host rate limits are enforced by the
+        # API clients, so the semaphore only caps outstanding work. An
+        # unexpected failure in one lookup must not abandon the others.
+        results = await asyncio.gather(
+            *(lookup_one(i, c) for i, c in to_lookup),
+            return_exceptions=True
+        )
+        for (i, _), result in zip(to_lookup, results):
+            if isinstance(result, Exception):
+                logger.error(f"Unexpected error on citation {i+1} for job {job_id}: {result}")
+        
         job["status"] = "completed"
         job["progress"] = 100
         job["completed_at"] = datetime.now().isoformat()
@@ -1290,23 +2473,54 @@ async def process_document(job_id: str):
         final_stats = {
             "total": total_citations,
             "processed": processed,
+            "existing_dois": existing_dois,
             "dois_found": successful_lookups,
-            "processing_time": (datetime.now() - start_time).seconds
+            "processing_time": int(loop.time() - start_time)
         }
         
         job["final_stats"] = final_stats
+        jobs.save(job)
         
         logger.info(f"Job {job_id} completed successfully:")
         logger.info(f"  - Total citations: {total_citations}")
         logger.info(f"  - Citations processed: {processed}")
+        logger.info(f"  - Existing DOIs: {existing_dois}")
         logger.info(f"  - DOIs found: {successful_lookups}")
         logger.info(f"  - Processing time: {final_stats['processing_time']} seconds")
         
+    except asyncio.TimeoutError:
+        # Only extraction can overrun here; lookups handle their own deadline
+        logger.error(f"Job {job_id} hit the time limit during citation extraction")
+        job["status"] = "error"
+        job["error"] = f"Processing exceeded the {JOB_TIME_LIMIT // 60} minute limit"
+        job["progress"] = 0
+        jobs.save(job)
+        
     except Exception as e:
         logger.error(f"Critical error processing job {job_id}: {e}")
         job["status"] = "error"
         job["error"] = str(e)
         job["progress"] = 0
+        jobs.save(job)
+
+def citation_stats(citations: List[Dict]) -> Dict[str, int]:
+    """
+    Count citations by lookup status in a single pass.
+    
+    Args:
+        citations (List[Dict]): Citation objects of a job
+        
+    Returns:
+        Dict[str, int]: total plus has_doi, found, not_found and pending counts
+    """
+    counts = Counter(c["status"] for c in citations)
+    return {
+        "total": len(citations),
+        "has_doi": counts["has_doi"],
+        "found": counts["found"],
+        "not_found": counts["not_found"],
+        "pending": counts["pending"]
+    }
 
 @app.get("/job/{job_id}")
 async def get_job_status(job_id: str):
@@ -1326,20 +2540,13 @@ async def get_job_status(job_id: str):
         HTTPException: If job ID is not found
     """
     
-    if job_id not in jobs:
+    job = jobs.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    job = jobs[job_id]
     
     # Calculate citation statistics for dashboard display
-    citations = job.get("citations", [])
-    stats = {
-        "total": len(citations),
-        "has_doi": len([c for c in citations if c["status"] == "has_doi"]),
-        "found": len([c for c in citations if c["status"] == "found"]),
-        "not_found": len([c for c in citations if c["status"] == "not_found"]),
-        "pending": len([c for c in citations if c["status"] == "pending"])
-    }
+    stats = citation_stats(job.get("citations", []))
     
     return {
         "job": job,
@@ -1366,19 +2573,14 @@ async def review_results(request: Request, job_id: str):
         HTTPException: If job ID is not found
     """
     
-    if job_id not in jobs:
+    job = jobs.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    job = jobs[job_id]
     citations = job.get("citations", [])
     
     # Calculate statistics for the review page
-    stats = {
-        "total": len(citations),
-        "has_doi": len([c for c in citations if c["status"] == "has_doi"]),
-        "found": len([c for c in citations if c["status"] == "found"]),
-        "not_found": len([c for c in citations if c["status"] == "not_found"])
-    }
+    stats = citation_stats(citations)
     
     return templates.TemplateResponse("review.html", {
         "request": request,
@@ -1406,7 +2608,8 @@ async def apply_dois(job_id: str, request: Request):
         HTTPException: If job not found or processing fails
     """
     
-    if job_id not in jobs:
+    job = jobs.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
     
     # Parse request data
@@ -1416,7 +2619,6 @@ async def apply_dois(job_id: str, request: Request):
     selected_citations = data.get("selected_citations", [])
     citation_updates = data.get("citation_updates", {})
     
-    job = jobs[job_id]
     citations = job["citations"]
     
     # Apply user edits to citations
@@ -1431,9 +2633,13 @@ async def apply_dois(job_id: str, request: Request):
                 citation["status"] = "found"
                 citation["confidence"] = 0.5  # User-provided DOI
     
+    jobs.save(job)
+    
     try:
-        # Generate document with applied DOIs
-        output_path = apply_dois_to_document(
+        # Generate document with applied DOIs; rewriting the document is
+        # blocking python-docx work, so keep it off the event loop
+        output_path = await asyncio.to_thread(
+            apply_dois_to_document,
             job["filepath"],
             citations,
             apply_mode,
@@ -1441,6 +2647,7 @@ async def apply_dois(job_id: str, request: Request):
         )
         
         job["output_path"] = output_path
+        jobs.save(job)
         return {"status": "success", "download_url": f"/download/{job_id}"}
         
     except Exception as e:
@@ -1464,10 +2671,10 @@ async def download_result(job_id: str):
         HTTPException: If job not found or file not available
     """
     
-    if job_id not in jobs:
+    job = jobs.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    job = jobs[job_id]
     if "output_path" not in job or not os.path.exists(job["output_path"]):
         raise HTTPException(status_code=404, detail="Processed file not found")
     
@@ -1477,46 +2684,76 @@ async def download_result(job_id: str):
         media_type='application/vnd.openxmlformats-officedocument.wordprocessingml.document'
     )
 
-from fastapi.responses import Response
+# Columns of the citation CSV export
+CSV_HEADER = [
+    "ID", "Original Citation", "Status", "DOI", "Confidence",
+    "Title", "Authors", "Journal", "Year", "Source"
+]
+
+# Rows encoded per chunk of the streamed CSV export
+CSV_BATCH_ROWS = 1000
+
+def citation_csv_row(citation: Dict) -> List:
+    """Return the CSV export row for one citation, in CSV_HEADER order."""
+    metadata = citation.get("metadata", {})
+    return [
+        citation["id"],
+        citation["original"],
+        citation["status"],
+        citation.get("doi", ""),
+        citation.get("confidence", ""),
+        metadata.get("title", ""),
+        metadata.get("authors", ""),
+        metadata.get("journal", ""),
+        metadata.get("year", ""),
+        citation.get("source", "")
+    ]
 
 @app.get("/export/{job_id}")
 async def export_csv(job_id: str):
-    if job_id not in jobs:
+    """
+    Export a job's citations as a CSV download.
+    
+    Rows are encoded and streamed to the client in batches of CSV_BATCH_ROWS,
+    so the whole file is never held in memory while each chunk is still
+    large enough to keep per-chunk overhead low.
+    
+    Args:
+        job_id (str): Unique job identifier
+        
+    Returns:
+        StreamingResponse: text/csv attachment, one row per citation
+        
+    Raises:
+        HTTPException: If job ID is not found
+    """
+    job = jobs.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    job = jobs[job_id]
     citations = job.get("citations", [])
 
-    csv_data = io.StringIO()
-    writer = csv.writer(csv_data)
-
-    # Write CSV header
-    writer.writerow([
-        "ID", "Original Citation", "Status", "DOI", "Confidence",
-        "Title", "Authors", "Journal", "Year", "Source"
-    ])
+    async def csv_rows():
+        # One writer over one buffer, emptied after every batch of rows
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(CSV_HEADER)
+        
+        rows = map(citation_csv_row, citations)
+        while batch := list(islice(rows, CSV_BATCH_ROWS)):
+            writer.writerows(batch)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+            # Let other requests run between batches of a large export
+            await asyncio.sleep(0)
+        
+        # Header only, for a job without citations
+        if buffer.tell():
+            yield buffer.getvalue()
 
-    # Write citation rows
-    for citation in citations:
-        metadata = citation.get("metadata", {})
-        writer.writerow([
-            citation["id"],
-            citation["original"],
-            citation["status"],
-            citation.get("doi", ""),
-            citation.get("confidence", ""),
-            metadata.get("title", ""),
-            metadata.get("authors", ""),
-            metadata.get("journal", ""),
-            metadata.get("year", ""),
-            citation.get("source", "")
-        ])
-
-    csv_content = csv_data.getvalue()
-    csv_data.close()
-
-    return Response(
-        content=csv_content,
+    return StreamingResponse(
+        csv_rows(),
         media_type="text/csv",
         headers={
             "Content-Disposition": f"attachment; filename=citations_{job_id}.csv"
@@ -1542,8 +2779,10 @@ if __name__ == "__main__":
     """
     Start the FastAPI application server.
     
-    This runs the application in development mode with hot reloading.
-    For production deployment, use a proper ASGI server like Gunicorn.
+    Runs WEB_CONCURRENCY Uvicorn worker processes. Jobs, lookup results and
+    documents live in the shared job store, cache and TEMP_DIR, so any
+    worker can serve any request. For production deployment, Gunicorn
+    with Uvicorn workers adds worker supervision and graceful restarts.
     """
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, workers=WEB_CONCURRENCY)
\ No newline at end of file
@@ -87,8 +87,12 @@ document.addEventListener('DOMContentLoaded', function() {
             const jobId = result.job_id;
             sessionStorage.setItem('currentJobId', jobId);
 
-            // EXTENDED polling for complete processing
-            await pollJobStatusExtended(jobId);
+            // Progress is pushed over Server-Sent Events; polling is the fallback
+            if (window.EventSource) {
+                watchJobEvents(jobId);
+            } else {
+                await pollJobStatusExtended(jobId);
+            }
 
         } catch (error) {
             console.error('Upload error:', error);
@@ -97,6 +101,51 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     });
 
+    function watchJobEvents(jobId) {
+        updateProgress(50, 'Extracting citations...');
+        
+        const events = new EventSource(`/events/${jobId}`);
+        let finished = false;
+        
+        events.onmessage = function(e) {
+            const event = JSON.parse(e.data);
+            
+            if (event.status === 'completed') {
+                finished = true;
+                events.close();
+                updateProgress(100, 'Complete! Redirecting...');
+                setTimeout(() => {
+                    window.location.href = `/review/${jobId}`;
+                }, 1000);
+            } else if (event.status === 'error') {
+                finished = true;
+                events.close();
+                alert('Processing error: ' + (event.error || 'Processing failed'));
+                resetForm();
+            } else if (event.status === 'processing') {
+                const progress = event.progress || 60;
+                let currentStep;
+                if (progress < 30) {
+                    currentStep = 'Parsing document structure...';
+                } else if (progress < 50 && !event.total) {
+                    currentStep = 'Extracting citations...';
+                } else {
+                    currentStep = `Looking up DOIs... (${event.processed}/${event.total} processed)`;
+                }
+                updateProgress(Math.min(95, 50 + (progress * 0.4)), currentStep);
+            }
+        };
+        
+        events.onerror = function() {
+            // Connection dropped (proxy, server restart): fall back to polling
+            events.close();
+            if (!finished) {
+                finished = true;
+                pollJobStatusExtended(jobId);
+            }
+        };
+    }
+
     async function pollJobStatusExtended(jobId) {
         try {
             updateProgress(50, 'Extracting citations...');
@@ -129,14 +178,14 @@ document.addEventListener('DOMContentLoaded', function() {
                     const progress = job.progress || 60;
                     
                     // Show detailed progress with citation counts
+                    const totalCitations = job.total_citations || stats.total || 0;
+                    const processedCitations = job.processed_citations || 0;
                     let currentStep;
                     if (progress < 30) {
                         currentStep = 'Parsing document structure...';
                     } else if (progress < 50) {
                         currentStep = 'Extracting citations...';
                     } else {
-                        const totalCitations = stats.total || 0;
-                        const processedCitations = (stats.has_doi || 0) + (stats.found || 0) + (stats.not_found || 0);
                         currentStep = `Looking up DOIs... (${processedCitations}/${totalCitations} processed)`;
                     }
                     
@@ -0,0 +1,13 @@
+import os
+import sys
+import tempfile
+
+# main.py opens its stores and mounts static/ relative to the repository
+# root at import time; keep the stores out of the working tree
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_STATE_DIR = tempfile.mkdtemp(prefix="doi-finder-tests-")
+os.environ.setdefault("DOI_CACHE_DIR", os.path.join(_STATE_DIR, "cache"))
+os.environ.setdefault("JOB_STORE_DIR", os.path.join(_STATE_DIR, "jobs"))
+os.environ.setdefault("TEMP_DIR", os.path.join(_STATE_DIR, "temp"))
+os.chdir(ROOT)
+sys.path.insert(0, ROOT)
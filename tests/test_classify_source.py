@@ -0,0 +1,33 @@
+import pytest
+
+from main import classify_source
+
+
+@pytest.mark.parametrize("citation", [
+    "Smith J, Lee K. Statin therapy in older adults. J Am Coll Cardiol. 2019;74(3):123-130.",
+    "Brown A. Outcomes of sepsis care. N Engl J Med. 2020;382(5):401-410.",
+    "Garcia R. Effects of exercise on mood. Lancet. 2018;392(10159):1-9.",
+    "Chen L. Screening uptake in primary care. JAMA. 2021;325(2):150-158.",
+    "Patel S. Wound healing after surgery. J Surg Res. 2017;210:45-52.",
+])
+def test_biomedical_citations_go_to_pubmed_first(citation):
+    assert classify_source(citation) == "pubmed_first"
+
+
+@pytest.mark.parametrize("citation", [
+    "Vaswani A, Shazeer N. Attention is all you need. Adv Neural Inf Process Syst. 2017;30:5998-6008.",
+    "Kim H. Vehicle routing with time windows. Eur J Oper Res. 2019;274(2):101-115.",
+    "Viola P, Jones M. Robust real-time face detection. Int J Comput Vis. 2004;60(2):137-154.",
+    "Card D. Immigration and wages. Am Econ Rev. 2010;100(3):21-45.",
+])
+def test_non_biomedical_ama_citations_search_both(citation):
+    assert classify_source(citation) == "both"
+
+
+@pytest.mark.parametrize("citation", [
+    "Lee K. Graph search. In: Proceedings of the IEEE Conference on Computer Vision. 2020.",
+    "Doe J. Deep learning survey. arXiv:2101.00001. 2021.",
+    "Roe P. Statistical Methods. Oxford University Press; 2015.",
+])
+def test_proceedings_books_and_preprints_go_to_crossref_first(citation):
+    assert classify_source(citation) == "crossref_first"
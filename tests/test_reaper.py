@@ -0,0 +1,40 @@
+import os
+import uuid
+
+import main
+
+
+def _old_file(path):
+    with open(path, "w") as f:
+        f.write("x")
+    os.utime(path, (0, 0))
+    return path
+
+
+def test_sweep_removes_only_unreferenced_app_documents(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "TEMP_DIR", str(tmp_path))
+    
+    kept = uuid.uuid4().hex
+    orphan = uuid.uuid4().hex
+    kept_upload = _old_file(tmp_path / f"{kept}.docx")
+    kept_output = _old_file(tmp_path / f"{kept}_with_dois.docx")
+    orphan_upload = _old_file(tmp_path / f"{orphan}.docx")
+    orphan_output = _old_file(tmp_path / f"{orphan}_with_dois.docx")
+    foreign = [
+        _old_file(tmp_path / "notes.txt"),
+        _old_file(tmp_path / "report.docx"),
+        _old_file(tmp_path / f"{orphan}.docx.bak"),
+    ]
+    
+    job_id = str(uuid.uuid4())
+    main.jobs[job_id] = {
+        "id": job_id,
+        "status": "completed",
+        "filepath": str(kept_upload),
+        "output_path": str(kept_output),
+    }
+    
+    assert main.reap_expired_jobs() == 2
+    assert kept_upload.exists() and kept_output.exists()
+    assert not orphan_upload.exists() and not orphan_output.exists()
+    assert all(path.exists() for path in foreign)